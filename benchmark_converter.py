@@ -0,0 +1,256 @@
+"""Benchmark untuk setiap jalur konversi yang terdaftar di CONVERSION_CONFIG.
+
+Membuat fixture sintetis (gambar JPG/PNG/WEBP/HEIC di beberapa resolusi,
+CSV/XLSX di beberapa jumlah baris, DOCX sederhana), lalu mengukur setiap
+pasangan format dari -> ke serta pencarian kualitas Kompresi. Setiap kasus
+dijalankan di proses terpisah agar peak RSS tidak saling mempengaruhi.
+
+    python benchmark_converter.py -o hasil_bench.json
+    python benchmark_converter.py --quick --compare hasil_bench.json
+"""
+import os
+import sys
+import csv
+import json
+import time
+import zipfile
+import platform
+import argparse
+import tempfile
+import multiprocessing
+
+import converter_file
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+IMAGE_RESOLUTIONS = [(640, 480), (1920, 1080), (4000, 3000)]
+QUICK_IMAGE_RESOLUTIONS = [(640, 480), (1920, 1080)]
+TABLE_ROWS = [1_000, 10_000, 100_000]
+QUICK_TABLE_ROWS = [1_000, 10_000]
+# Target Kompresi relatif terhadap ukuran fixture: input yang sudah di bawah
+# target hanya disalin, jadi target tetap (mis. 500 KB) tidak lagi mengukur encoder.
+KOMPRESI_TARGET_FRACTIONS = [0.25, 0.5]
+
+IMAGE_SAVE_FORMATS = {"JPG": "JPEG", "PNG": "PNG", "WEBP": "WEBP", "HEIC": "HEIF"}
+
+DOCX_CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
+</Types>"""
+DOCX_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>
+</Relationships>"""
+DOCX_PARAGRAPH = "<w:p><w:r><w:t>Paragraf benchmark {0}: Lorem ipsum dolor sit amet.</w:t></w:r></w:p>"
+
+def _make_image(path, size, save_format):
+    Image = converter_file._pil_image(heif=save_format == "HEIF")
+    from PIL import ImageFilter
+
+    gradient = Image.linear_gradient("L").resize(size)
+    noise = Image.effect_noise(size, 64)
+    detail = Image.effect_noise(size, 32).filter(ImageFilter.GaussianBlur(2))
+    img = Image.merge("RGB", (gradient, noise, detail)).filter(ImageFilter.GaussianBlur(1))
+    img.save(path, save_format)
+
+def _make_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "nama", "nilai", "aktif", "tanggal"])
+        for i in range(rows):
+            writer.writerow([i, f"item-{i}", round(i * 1.37, 2), i % 2 == 0, f"2024-01-{i % 28 + 1:02d}"])
+
+def _make_docx(path, paragraphs=200):
+    body = "".join(DOCX_PARAGRAPH.format(i) for i in range(paragraphs))
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f"<w:body>{body}</w:body></w:document>"
+    )
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as docx:
+        docx.writestr("[Content_Types].xml", DOCX_CONTENT_TYPES)
+        docx.writestr("_rels/.rels", DOCX_RELS)
+        docx.writestr("word/document.xml", document)
+
+def build_fixtures(folder, quick=False):
+    """Buat fixture sintetis; mengembalikan dict format -> list (label, path)."""
+    fixtures = {}
+    resolutions = QUICK_IMAGE_RESOLUTIONS if quick else IMAGE_RESOLUTIONS
+    for fmt, save_format in IMAGE_SAVE_FORMATS.items():
+        for width, height in resolutions:
+            label = f"{width}x{height}"
+            path = os.path.join(folder, f"img_{label}.{fmt.lower()}")
+            try:
+                _make_image(path, (width, height), save_format)
+            except Exception as e:
+                print(f"Lewati fixture {fmt} {label}: {e}", file=sys.stderr)
+                continue
+            fixtures.setdefault(fmt, []).append((label, path))
+
+    for rows in (QUICK_TABLE_ROWS if quick else TABLE_ROWS):
+        label = f"{rows}_baris"
+        csv_path = os.path.join(folder, f"tabel_{label}.csv")
+        xlsx_path = os.path.join(folder, f"tabel_{label}.xlsx")
+        _make_csv(csv_path, rows)
+        converter_file.stream_csv_to_xlsx(csv_path, xlsx_path)
+        fixtures.setdefault("CSV", []).append((label, csv_path))
+        fixtures.setdefault("XLSX", []).append((label, xlsx_path))
+
+    docx_path = os.path.join(folder, "dokumen.docx")
+    _make_docx(docx_path)
+    fixtures["DOCX"] = [("200_paragraf", docx_path)]
+    return fixtures
+
+def build_cases(fixtures, output_folder):
+    cases = []
+    for category, config in converter_file.CONVERSION_CONFIG.items():
+        for from_format, output_formats in config["output_map"].items():
+            for to_format in output_formats:
+                for label, input_path in fixtures.get(from_format, []):
+                    fractions = KOMPRESI_TARGET_FRACTIONS if category == "Kompresi" else [None]
+                    for fraction in fractions:
+                        target_size_kb = None
+                        if fraction is not None:
+                            target_size_kb = max(1, int(os.path.getsize(input_path) * fraction / 1024))
+                        job = converter_file.make_job(
+                            input_path, output_folder, category, from_format, to_format, target_size_kb
+                        )
+                        cases.append({"fixture": label, "target_fraction": fraction, "job": job})
+    return cases
+
+def _peak_rss_mb():
+    # VmHWM milik address space proses ini saja; ru_maxrss di Linux bisa
+    # mewarisi nilai proses induk ketika worker dibuat lewat fork+exec.
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux melaporkan KB, macOS melaporkan byte.
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+def _run_case(case):
+    """Dijalankan di proses anak baru: ukur satu konversi."""
+    job = case["job"]
+    Image = converter_file._pil_image(heif=True)
+    encode_count = 0
+    original_save = Image.Image.save
+
+    def counting_save(self, *args, **kwargs):
+        nonlocal encode_count
+        encode_count += 1
+        return original_save(self, *args, **kwargs)
+
+    Image.Image.save = counting_save
+    start = time.perf_counter()
+    ok = converter_file.convert_file(**job)
+    wall = time.perf_counter() - start
+
+    outputs = converter_file.job_outputs(job["to_format"], job["output_path"])
+    output_bytes = sum(os.path.getsize(path) for _, path in outputs if os.path.exists(path))
+    for _, path in outputs:
+        if os.path.exists(path):
+            os.remove(path)
+
+    return {
+        "category": job["category"],
+        "from_format": job["from_format"],
+        "to_format": job["to_format"],
+        "fixture": case["fixture"],
+        "target_size_kb": job["target_size_kb"],
+        "target_fraction": case["target_fraction"],
+        "ok": ok,
+        "wall_s": round(wall, 4),
+        "peak_rss_mb": _peak_rss_mb(),
+        "encode_count": encode_count,
+        "input_bytes": os.path.getsize(job["input_path"]),
+        "output_bytes": output_bytes,
+    }
+
+def run_benchmark(quick=False, repeat=1, only=None):
+    context = multiprocessing.get_context("spawn")
+    results = []
+    with tempfile.TemporaryDirectory(prefix="bench_converter_") as folder:
+        output_folder = os.path.join(folder, "output")
+        os.makedirs(output_folder)
+        cases = build_cases(build_fixtures(folder, quick=quick), output_folder)
+        if only:
+            cases = [case for case in cases if case["job"]["category"].lower() in only]
+
+        for index, case in enumerate(cases, 1):
+            runs = []
+            for _ in range(repeat):
+                with context.Pool(1, maxtasksperchild=1) as pool:
+                    runs.append(pool.apply(_run_case, (case,)))
+            result = min(runs, key=lambda run: run["wall_s"])
+            result["repeat"] = repeat
+            results.append(result)
+            print(
+                f"[{index}/{len(cases)}] {result['category']} {result['from_format']}->{result['to_format']} "
+                f"{result['fixture']}: {result['wall_s']} s, {result['peak_rss_mb']} MB, "
+                f"{result['encode_count']} encode, {'OK' if result['ok'] else 'GAGAL'}",
+                file=sys.stderr
+            )
+
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "quick": quick,
+        },
+        "results": results,
+    }
+
+def _case_key(result):
+    # Ukuran fixture sedikit berbeda tiap run, jadi kasus Kompresi dicocokkan lewat fraksi targetnya.
+    target = result.get("target_fraction", result["target_size_kb"])
+    return (result["category"], result["from_format"], str(result["to_format"]), result["fixture"], target)
+
+def compare(report, baseline):
+    """Cetak rasio waktu terhadap hasil benchmark sebelumnya (nilai < 1 berarti lebih cepat)."""
+    previous = {_case_key(result): result for result in baseline["results"]}
+    for result in report["results"]:
+        old = previous.get(_case_key(result))
+        if not old or not old["wall_s"]:
+            continue
+        ratio = result["wall_s"] / old["wall_s"]
+        print(f"{' '.join(map(str, _case_key(result)))}: {old['wall_s']} s -> {result['wall_s']} s (x{ratio:.2f})")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark jalur konversi converter_file")
+    parser.add_argument("-o", "--output", help="Tulis hasil JSON ke file ini (default: stdout)")
+    parser.add_argument("--quick", action="store_true", help="Gunakan fixture kecil saja")
+    parser.add_argument("--repeat", type=int, default=1, help="Jumlah pengulangan per kasus (diambil yang tercepat)")
+    parser.add_argument("--category", action="append", help="Batasi ke kategori tertentu (boleh diulang)")
+    parser.add_argument("--compare", help="File JSON benchmark sebelumnya untuk dibandingkan")
+    args = parser.parse_args(argv)
+
+    only = {category.lower() for category in args.category} if args.category else None
+    report = run_benchmark(quick=args.quick, repeat=max(1, args.repeat), only=only)
+
+    text = json.dumps(report, indent=2, default=str)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(report, json.load(f))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,18 +1,58 @@
 import os
 import sys
-import tkinter as tk
-from tkinter import filedialog, messagebox
-import ttkbootstrap as ttk
-from ttkbootstrap.constants import *
-from PIL import Image
-from pillow_heif import register_heif_opener
+import argparse
+import csv
+import glob
+import contextlib
+import hashlib
+import json
+import shutil
+import tempfile
+import subprocess
+import pathlib
+import signal
+import queue
 import threading
 import io
+import math
+import re
 import time
-from docx2pdf import convert as docx_to_pdf
-import pandas as pd
+import zipfile
+import collections
+import multiprocessing
+import importlib.util
+import xml.etree.ElementTree as ElementTree
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, Future, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
 
-register_heif_opener()
+# Dependensi berat (GUI, Pillow, openpyxl, calamine, docx2pdf) diimpor secara lazy agar
+# mode CLI/library tidak membutuhkan tkinter dan start-up tetap cepat.
+tk = None
+ttk = None
+filedialog = None
+messagebox = None
+_heif_registered = False
+
+def _load_gui():
+    """Impor modul GUI hanya ketika aplikasi desktop dijalankan."""
+    global tk, ttk, filedialog, messagebox
+    import tkinter
+    from tkinter import filedialog as tk_filedialog, messagebox as tk_messagebox
+    import ttkbootstrap
+    tk = tkinter
+    ttk = ttkbootstrap
+    filedialog = tk_filedialog
+    messagebox = tk_messagebox
+
+def _pil_image(heif=False):
+    """Impor Pillow secara lazy; opener HEIF hanya didaftarkan bila diperlukan."""
+    global _heif_registered
+    from PIL import Image
+    if heif and not _heif_registered:
+        from pillow_heif import register_heif_opener
+        register_heif_opener()
+        _heif_registered = True
+    return Image
 
 def resource_path(relative_path):
     try:
@@ -21,90 +61,2895 @@ def resource_path(relative_path):
         base_path = os.path.abspath(".")
     return os.path.join(base_path, relative_path)
 
-CONVERSION_CONFIG = {
-    "Kompresi": {
-        "formats": ["JPG"],
-        "output_map": {
-            "JPG": ["JPG (Kualitas Dikompresi)"]
-        }
-    },
-    "Gambar": {
-        "formats": ["HEIC", "JPG", "PNG", "WEBP"],
-        "output_map": {
-            "HEIC": ["JPG", "PNG"],
-            "JPG": ["PNG", "WEBP", "ICO"],
-            "PNG": ["JPG", "WEBP", "ICO"],
-            "WEBP": ["JPG", "PNG"]
-        }
-    },
-    "Dokumen": {
-        "formats": ["DOCX", "XLSX", "CSV"],
-        "output_map": {
-            "DOCX": ["PDF"],
-            "XLSX": ["CSV"],
-            "CSV": ["XLSX"]
-        }
+DEFAULT_WORKERS = os.cpu_count() or 1
+# Bagian RAM fisik yang boleh dipakai bersamaan oleh job yang sedang berjalan.
+DEFAULT_MEMORY_FRACTION = 0.5
+
+FORMAT_EXTENSIONS = {
+    "JPG": (".jpg", ".jpeg"),
+    "PNG": (".png",),
+    "WEBP": (".webp",),
+    "HEIC": (".heic", ".heif"),
+    "DOCX": (".docx",),
+    "XLSX": (".xlsx",),
+    "CSV": (".csv",),
+}
+
+# Kategori -> format input dan format output yang tersedia. Diisi otomatis oleh
+# `register_converter`; jangan diubah langsung.
+CONVERSION_CONFIG = {}
+
+JPEG_QUALITY_MIN = 1
+JPEG_QUALITY_MAX = 95
+PROXY_MAX_PIXELS = 1_000_000
+PROXY_TILE = 128
+MAX_FULL_ENCODES = 2
+JPEG_OUTPUT_QUALITY = 95
+ICO_SIZES = [(16,16), (32,32), (48,48), (64,64), (128,128), (256,256)]
+
+def _encode_jpeg(img, quality, metadata=None):
+    buffer = io.BytesIO()
+    img.save(buffer, "JPEG", quality=quality, optimize=True, **(metadata or {}))
+    return buffer
+
+def _make_proxy(img):
+    """Buat mozaik (±`PROXY_MAX_PIXELS`) dari petak resolusi asli yang tersebar merata.
+
+    Gambar yang diperkecil kehilangan detail halus sehingga kurva ukuran-vs-kualitasnya
+    melenceng; petak resolusi asli mempertahankan detail itu, jadi ukuran mozaik ×
+    rasio piksel mendekati ukuran penuh di semua kualitas. Mengembalikan
+    `(None, 1.0)` bila gambar tidak lebih besar dari proxy, karena probe proxy
+    saat itu sama mahalnya dengan encode penuh.
+    """
+    pixels = img.width * img.height
+    if pixels <= PROXY_MAX_PIXELS:
+        return None, 1.0
+    # Petak sejajar blok MCU JPEG (16 px) agar sambungan antarpetak tidak memecah blok.
+    tile = min(PROXY_TILE, img.width, img.height) // 16 * 16 or min(img.width, img.height)
+    count = max(1, math.isqrt(PROXY_MAX_PIXELS // (tile * tile)))
+    proxy = _pil_image().new(img.mode, (count * tile, count * tile))
+    for column in range(count):
+        x = (img.width - tile) * (2 * column + 1) // (2 * count) // 16 * 16
+        for row in range(count):
+            y = (img.height - tile) * (2 * row + 1) // (2 * count) // 16 * 16
+            proxy.paste(img.crop((x, y, x + tile, y + tile)), (column * tile, row * tile))
+    return proxy, pixels / (proxy.width * proxy.height)
+
+def compress_jpeg_to_target(img, target_bytes, max_full_encodes=MAX_FULL_ENCODES, metadata=None):
+    """Cari kualitas JPEG tertinggi yang hasilnya tidak melebihi `target_bytes`.
+
+    Mozaik proxy hanya dipakai untuk menebak probe resolusi penuh (paling
+    banyak `max_full_encodes` tebakan, hanya sebelum ada dua probe penuh). Begitu ada dua probe
+    penuh, kualitas berikutnya diinterpolasi (secant pada log ukuran) dari
+    ukuran terukur yang paling dekat dengan target; bila secant dua kali
+    berturut-turut jatuh di sisi yang sama, dipakai binary search. Pencarian
+    berhenti begitu kualitas q muat dan q+1 tidak, jadi hasilnya tetap kualitas
+    tertinggi yang muat. `metadata` (EXIF/ICC) hanya ikut di encode penuh, jadi
+    ukurannya ikut dihitung terhadap target. Mengembalikan `(buffer, quality)`
+    dari probe pemenang sehingga tidak perlu encode ulang.
+    """
+    proxy, scale = _make_proxy(img)
+    proxy_sizes = {}
+
+    def proxy_size(quality):
+        if quality not in proxy_sizes:
+            proxy_sizes[quality] = _encode_jpeg(proxy, quality).tell()
+        return proxy_sizes[quality]
+
+    def predict(low, high):
+        best = low
+        while low <= high:
+            mid = (low + high) // 2
+            if proxy_size(mid) * scale <= target_bytes:
+                best = mid
+                low = mid + 1
+            else:
+                high = mid - 1
+        return best
+
+    def secant(a, b):
+        (qa, sa), (qb, sb) = sorted((a, b))
+        slope = (math.log(max(sb, 1)) - math.log(max(sa, 1))) / (qb - qa)
+        if slope <= 0:
+            return None
+        return qa + math.floor((math.log(target_bytes) - math.log(max(sa, 1))) / slope)
+
+    low = JPEG_QUALITY_MIN
+    high = JPEG_QUALITY_MAX
+    # Probe penuh terakhir yang muat dan yang melebihi target: (kualitas, ukuran).
+    fit = None
+    over = None
+    last = None
+    last_fits = None
+    best_buffer = None
+    fallback_buffer = None
+    guesses = 0
+    same_side = 0
+
+    while low <= high:
+        quality = None
+        if fit is not None and over is not None:
+            if same_side < 2:
+                quality = secant(fit, over)
+        elif last is not None:
+            # Belum mengapit target: ekstrapolasi dari dua probe di sisi yang sama.
+            quality = secant(fit or over, last)
+        elif proxy is not None and guesses < max_full_encodes:
+            quality = predict(low, high)
+            guesses += 1
+        if quality is None:
+            quality = (low + high) // 2
+        quality = min(max(quality, low), high)
+
+        buffer = _encode_jpeg(img, quality, metadata)
+        size = buffer.tell()
+        if proxy is not None:
+            scale = size / max(proxy_size(quality), 1)
+        fits = size <= target_bytes
+        if fit is not None and over is not None:
+            same_side = same_side + 1 if fits == last_fits else 1
+        last_fits = fits
+        last = fit if fits else over
+
+        if fits:
+            fit = (quality, size)
+            best_buffer = buffer
+            low = quality + 1
+        else:
+            over = (quality, size)
+            if quality == JPEG_QUALITY_MIN:
+                fallback_buffer = buffer
+            high = quality - 1
+
+    if best_buffer is not None:
+        return best_buffer, fit[0]
+    if fallback_buffer is None:
+        fallback_buffer = _encode_jpeg(img, JPEG_QUALITY_MIN, metadata)
+    return fallback_buffer, JPEG_QUALITY_MIN
+
+def _fsync_directory(folder):
+    # Di POSIX, rename baru tahan crash setelah entri direktorinya ikut di-fsync.
+    if os.name == "nt":
+        return
+    fd = os.open(folder, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def _default_file_mode():
+    """Mode file baru sesuai umask proses (mis. 0644), seperti `open()` biasa."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+# Dibaca sekali saat impor: mengubah umask sesaat tidak aman ketika thread lain sedang membuat file.
+OUTPUT_FILE_MODE = _default_file_mode()
+
+@contextlib.contextmanager
+def atomic_output(output_path, fsync=False):
+    """Berikan path sementara di folder tujuan; di-rename ke `output_path` hanya bila sukses.
+
+    Output yang gagal di tengah jalan tidak pernah muncul dengan nama akhirnya,
+    sehingga run berikutnya tidak mengira file terpotong sebagai hasil jadi.
+    Ekstensi asli dipertahankan agar backend yang membaca ekstensi tetap bekerja.
+    """
+    folder = os.path.dirname(os.path.abspath(output_path))
+    os.makedirs(folder, exist_ok=True)
+    base, ext = os.path.splitext(os.path.basename(output_path))
+    fd, temp_path = tempfile.mkstemp(dir=folder, prefix=f".{base}.", suffix=f".part{ext}")
+    os.close(fd)
+    try:
+        yield temp_path
+        # mkstemp membuat file 0600; tanpa ini output tidak terbaca user lain.
+        os.chmod(temp_path, OUTPUT_FILE_MODE)
+        if fsync:
+            with open(temp_path, "rb+") as f:
+                os.fsync(f.fileno())
+        os.replace(temp_path, output_path)
+        if fsync:
+            _fsync_directory(folder)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+def copy_output(input_path, output_path, fsync=False):
+    """Salin file apa adanya secara atomik, tanpa decode maupun encode."""
+    with atomic_output(output_path, fsync) as temp_path:
+        shutil.copyfile(input_path, temp_path)
+
+def write_output(buffer, output_path, fsync=False):
+    """Tulis isi BytesIO secara atomik langsung dari memoryview `getbuffer()` tanpa salinan byte."""
+    with atomic_output(output_path) as temp_path:
+        with open(temp_path, "wb") as f:
+            f.write(buffer.getbuffer())
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+    if fsync:
+        _fsync_directory(os.path.dirname(os.path.abspath(output_path)))
+
+CSV_BOOL_VALUES = {"True": True, "TRUE": True, "False": False, "FALSE": False}
+
+def _coerce_csv_value(value):
+    """Ubah teks sel CSV menjadi angka/boolean bila memungkinkan (mirip inferensi pandas)."""
+    if value == "":
+        return None
+    if value in CSV_BOOL_VALUES:
+        return CSV_BOOL_VALUES[value]
+    if "_" in value:
+        return value
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        number = float(value)
+    except ValueError:
+        return value
+    return number if math.isfinite(number) else value
+
+def _cast_int(value):
+    if isinstance(value, str):
+        value = value.strip()
+        if value.lstrip("+-").isdigit():
+            return int(value)
+        value = float(value)
+    if isinstance(value, float) and not value.is_integer():
+        raise ValueError(f"bukan bilangan bulat: {value!r}")
+    return int(value)
+
+def _cast_bool(value):
+    if isinstance(value, str):
+        if value.strip() not in CSV_BOOL_VALUES:
+            raise ValueError(f"bukan boolean: {value!r}")
+        return CSV_BOOL_VALUES[value.strip()]
+    return bool(value)
+
+def _cast_str(value):
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+# Tipe kolom yang boleh dipakai di skema dtype (`--dtypes`).
+DTYPE_CASTS = {"str": _cast_str, "int": _cast_int, "float": float, "bool": _cast_bool}
+
+def load_dtype_schema(spec):
+    """Baca skema dtype dari file JSON `{"kolom": "int"}` atau teks `kolom:int,kolom2:str`."""
+    if not spec:
+        return None
+    if isinstance(spec, dict):
+        schema = dict(spec)
+    elif os.path.isfile(spec):
+        with open(spec, encoding="utf-8") as f:
+            schema = json.load(f)
+    else:
+        schema = {}
+        for item in spec.split(","):
+            name, _, dtype = item.rpartition(":")
+            if not name:
+                raise ValueError(f"Format skema dtype tidak valid: {item!r} (gunakan kolom:tipe)")
+            schema[name.strip()] = dtype.strip()
+    unknown = {dtype for dtype in schema.values() if dtype not in DTYPE_CASTS}
+    if unknown:
+        raise ValueError(f"Tipe dtype tidak dikenal: {', '.join(sorted(unknown))}. Pilihan: {', '.join(DTYPE_CASTS)}")
+    return schema
+
+def _column_casts(header, dtypes, default=None):
+    """Fungsi konversi per kolom; kolom di luar skema memakai `default`."""
+    dtypes = dtypes or {}
+    return [DTYPE_CASTS[dtypes[name]] if name in dtypes else default for name in header]
+
+def _apply_casts(row, casts, row_number):
+    values = []
+    for index, value in enumerate(row):
+        cast = casts[index] if index < len(casts) else None
+        if cast is None or value is None or value == "":
+            values.append(None if value == "" else value)
+            continue
+        try:
+            values.append(cast(value))
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Baris {row_number}, kolom {index + 1}: {e}") from None
+    return values
+
+def _throughput(rows, start_time):
+    seconds = time.time() - start_time
+    return {
+        "rows": rows,
+        "seconds": round(seconds, 3),
+        "rows_per_sec": round(rows / seconds, 1) if seconds > 0 else 0.0,
     }
+
+def stream_csv_to_xlsx(input_path, output_path, fsync=False, dtypes=None):
+    """Konversi CSV ke XLSX baris per baris dengan workbook write-only.
+
+    Pemakaian memori konstan berapa pun ukuran file. Kolom yang ada di skema
+    `dtypes` langsung dikonversi ke tipenya tanpa inferensi per sel.
+    Mengembalikan statistik jumlah baris dan throughput (baris/detik).
+    """
+    from openpyxl import Workbook
+
+    start_time = time.time()
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Sheet1")
+    rows = 0
+    try:
+        with open(input_path, newline="", encoding="utf-8-sig") as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is not None:
+                sheet.append(header)
+            if dtypes:
+                casts = _column_casts(header or [], dtypes, default=_coerce_csv_value)
+                for row in reader:
+                    rows += 1
+                    sheet.append(_apply_casts(row, casts, rows + 1))
+            else:
+                for row in reader:
+                    sheet.append([_coerce_csv_value(value) for value in row])
+                    rows += 1
+    except BaseException:
+        # Tutup file sementara milik worksheet write-only sebelum error diteruskan.
+        sheet.close()
+        raise
+    with atomic_output(output_path, fsync) as temp_path:
+        workbook.save(temp_path)
+    return _throughput(rows, start_time)
+
+XLSX_ENGINES = ("auto", "openpyxl", "calamine")
+# Nilai opsi `sheets` untuk mengekspor semua sheet workbook.
+ALL_SHEETS = "all"
+SPREADSHEET_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+INVALID_FILENAME_CHARS = re.compile(r'[\\/:*?"<>|]+')
+
+def xlsx_sheet_names(path):
+    """Nama sheet XLSX dibaca langsung dari `xl/workbook.xml` tanpa memuat workbook."""
+    with zipfile.ZipFile(path) as archive, archive.open("xl/workbook.xml") as f:
+        return [element.get("name") for element in ElementTree.parse(f).iter(f"{SPREADSHEET_NS}sheet")]
+
+def sheet_output_path(output_path, sheet):
+    base, ext = os.path.splitext(output_path)
+    return f"{base}_{INVALID_FILENAME_CHARS.sub('_', sheet)}{ext}"
+
+def _calamine_value(value, datetime):
+    # Calamine mengembalikan semua angka sebagai float dan sel tanggal sebagai
+    # `date`; samakan dengan openpyxl yang membaca bilangan bulat sebagai int
+    # dan setiap tanggal sebagai `datetime`.
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if type(value) is datetime.date:
+        return datetime.datetime.combine(value, datetime.time())
+    return None if value == "" else value
+
+def _csv_cell(value, datetime_type):
+    # Tanggal tanpa jam ditulis "2024-02-01" seperti keluaran pandas sebelumnya,
+    # bukan str(datetime) yang menambahkan " 00:00:00".
+    if value is None:
+        return ""
+    if isinstance(value, datetime_type) and not (value.hour or value.minute or value.second or value.microsecond):
+        return value.date().isoformat()
+    return value
+
+def _calamine_rows(sheet):
+    # Diimpor sekali per sheet, bukan per sel.
+    import datetime
+
+    for row in sheet.iter_rows():
+        yield [_calamine_value(value, datetime) for value in row]
+
+def resolve_xlsx_engine(engine=None):
+    """Engine XLSX yang benar-benar dipakai: "auto" menjadi calamine bila terpasang, selain itu openpyxl."""
+    if engine in (None, "auto"):
+        return "calamine" if importlib.util.find_spec("python_calamine") else "openpyxl"
+    return engine
+
+@contextlib.contextmanager
+def _open_xlsx(input_path, engine="auto"):
+    """Buka workbook sekali; menghasilkan `(nama_sheet, rows_of)` dengan `rows_of(nama)` iterator baris.
+
+    Engine "calamine" (python-calamine, opsional) jauh lebih cepat untuk
+    workbook lebar; "auto" memakainya bila terpasang, selain itu openpyxl
+    mode read-only. Nilai sel dari kedua engine dinormalisasi ke bentuk
+    openpyxl sehingga CSV hasilnya sama.
+    """
+    engine = resolve_xlsx_engine(engine)
+    if engine == "calamine":
+        from python_calamine import CalamineWorkbook
+
+        workbook = CalamineWorkbook.from_path(input_path)
+        try:
+            yield workbook.sheet_names, lambda name: _calamine_rows(workbook.get_sheet_by_name(name))
+        finally:
+            workbook.close()
+    else:
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(input_path, read_only=True, data_only=True)
+        try:
+            yield workbook.sheetnames, lambda name: workbook[name].iter_rows(values_only=True)
+        finally:
+            workbook.close()
+
+def stream_xlsx_to_csv(input_path, output_path, fsync=False, sheets=None, dtypes=None, engine="auto"):
+    """Konversi XLSX ke CSV memakai iterator baris, dengan satu kali membuka workbook.
+
+    Tanpa `sheets` hanya sheet pertama yang diekspor ke `output_path`. Dengan
+    `sheets` (list nama atau `ALL_SHEETS`) setiap sheet ditulis ke file
+    sendiri; `output_path` berupa list berpasangan atau satu path dasar yang
+    diberi akhiran nama sheet. Kolom di skema `dtypes` (berdasarkan header)
+    dikonversi ke tipenya. Mengembalikan statistik jumlah baris dan
+    throughput (baris/detik) serta jumlah baris per sheet.
+    """
+    import datetime
+
+    start_time = time.time()
+    total_rows = 0
+    sheet_rows = {}
+    with _open_xlsx(input_path, engine) as (sheet_names, rows_of):
+        if sheets is None:
+            targets = [(sheet_names[0], output_path)]
+        else:
+            selected = sheet_names if sheets == ALL_SHEETS else list(sheets)
+            missing = [name for name in selected if name not in sheet_names]
+            if missing:
+                raise KeyError(f"Sheet tidak ditemukan: {', '.join(missing)}")
+            if isinstance(output_path, (list, tuple)):
+                paths = list(output_path)
+            else:
+                paths = [sheet_output_path(output_path, name) for name in selected]
+            targets = list(zip(selected, paths))
+
+        for name, target_path in targets:
+            rows = 0
+            with atomic_output(target_path, fsync) as temp_path:
+                with open(temp_path, "w", newline="", encoding="utf-8") as f:
+                    writer = csv.writer(f, lineterminator=os.linesep)
+                    casts = None
+                    for row in rows_of(name):
+                        if casts is None:
+                            casts = _column_casts(row, dtypes) if dtypes else []
+                        elif casts:
+                            row = _apply_casts(row, casts, rows + 1)
+                        writer.writerow([_csv_cell(value, datetime.datetime) for value in row])
+                        rows += 1
+            sheet_rows[name] = max(rows - 1, 0)
+            total_rows += sheet_rows[name]
+    stats = _throughput(total_rows, start_time)
+    stats["sheets"] = sheet_rows
+    return stats
+
+def stream_csv_to_arrow(input_path, output_path, to_format, fsync=False, dtypes=None):
+    """Konversi CSV ke Parquet atau Feather (Arrow IPC) per batch memakai pyarrow.
+
+    Pembaca CSV streaming pyarrow membuat memori tetap kecil; kolom di skema
+    `dtypes` dipaksa ke tipenya, sisanya diinferensi pyarrow.
+    """
+    import pyarrow
+    from pyarrow import csv as arrow_csv
+
+    arrow_types = {"str": pyarrow.string(), "int": pyarrow.int64(), "float": pyarrow.float64(), "bool": pyarrow.bool_()}
+    convert_options = arrow_csv.ConvertOptions(
+        column_types={name: arrow_types[dtype] for name, dtype in (dtypes or {}).items()},
+        true_values=[value for value, flag in CSV_BOOL_VALUES.items() if flag],
+        false_values=[value for value, flag in CSV_BOOL_VALUES.items() if not flag],
+    )
+    start_time = time.time()
+    rows = 0
+    reader = arrow_csv.open_csv(input_path, convert_options=convert_options)
+    with atomic_output(output_path, fsync) as temp_path:
+        if to_format == "PARQUET":
+            from pyarrow import parquet
+
+            writer = parquet.ParquetWriter(temp_path, reader.schema)
+        else:
+            writer = pyarrow.ipc.new_file(
+                temp_path, reader.schema, options=pyarrow.ipc.IpcWriteOptions(compression="lz4")
+            )
+        with writer:
+            for batch in reader:
+                writer.write_batch(batch)
+                rows += batch.num_rows
+    return _throughput(rows, start_time)
+
+def job_outputs(to_format, output_path):
+    """Normalisasi target job menjadi daftar `(format, path)`.
+
+    `to_format`/`output_path` boleh berupa satu nilai atau list berpasangan
+    (mode multi-output kategori Gambar); satu format dengan list path dipakai
+    untuk ekspor banyak sheet XLSX.
+    """
+    if isinstance(to_format, (list, tuple)):
+        return list(zip(to_format, output_path))
+    if isinstance(output_path, (list, tuple)):
+        return [(to_format, path) for path in output_path]
+    return [(to_format, output_path)]
+
+def _fit_size(width, height, max_dimension):
+    scale = min(1.0, max_dimension / max(width, height))
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+def _ico_base_size(width, height):
+    """Ukuran terkecil yang masih memuat setiap ukuran ICO yang berlaku untuk gambar ini."""
+    largest = max(size[0] for size in ICO_SIZES)
+    scale = min(1.0, largest / min(width, height))
+    return math.ceil(width * scale), math.ceil(height * scale)
+
+class StageTimer:
+    """Kumpulkan durasi tiap tahap konversi (decode, transform, encode, write)."""
+
+    def __init__(self):
+        self.spans = {}
+
+    @contextlib.contextmanager
+    def span(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.spans[name] = self.spans.get(name, 0.0) + time.perf_counter() - start
+
+def _load_image(img, to_formats, max_dimension=None, timer=None):
+    """Decode gambar seperlunya lalu terapkan orientasi EXIF.
+
+    Bila hasil akhir lebih kecil dari sumber (opsi `max_dimension` atau hanya
+    output ICO), JPEG didecode dengan draft mode (skala 1/2, 1/4, 1/8) sehingga
+    gambar resolusi penuh tidak pernah dialokasikan. Rotasi dilakukan setelah
+    pengecilan agar hanya menyalin gambar yang sudah kecil; tag Orientation
+    ikut dihapus dari EXIF di `img.info`.
+    """
+    timer = timer or StageTimer()
+    width, height = img.size
+    if max_dimension:
+        target_size = _fit_size(width, height, max_dimension)
+    elif all(target_format == "ICO" for target_format in to_formats):
+        target_size = _ico_base_size(width, height)
+    else:
+        target_size = None
+
+    with timer.span("decode"):
+        if target_size and target_size != img.size:
+            img.draft(img.mode, target_size)
+        img.load()
+
+    if max_dimension and max(img.size) > max_dimension:
+        with timer.span("transform"):
+            img.thumbnail((max_dimension, max_dimension), _pil_image().Resampling.LANCZOS)
+
+    from PIL import ImageOps
+
+    with timer.span("transform"):
+        ImageOps.exif_transpose(img, in_place=True)
+    return img
+
+METADATA_FORMATS = ("JPG", "PNG", "WEBP")
+
+def _image_metadata(img, strip=False):
+    """Argumen save untuk membawa EXIF dan profil ICC sumber ke output.
+
+    Byte EXIF diambil mentah dari `img.info` (sudah tanpa tag Orientation
+    setelah `_load_image`), jadi tag lain termasuk maker note tidak ditulis ulang.
+    """
+    if strip:
+        return {}
+    return {key: img.info[key] for key in ("exif", "icc_profile") if img.info.get(key)}
+
+def _exact_palette(img):
+    """Konversi ke mode P hanya bila gambar punya ≤256 warna dan hasilnya identik piksel per piksel."""
+    if img.mode not in ("RGB", "RGBA"):
+        return None
+    colors = img.getcolors(256)
+    if colors is None:
+        return None
+    Image = _pil_image()
+    from PIL import ImageChops
+
+    method = Image.Quantize.FASTOCTREE if img.mode == "RGBA" else Image.Quantize.MEDIANCUT
+    palette = img.quantize(colors=len(colors), method=method, dither=Image.Dither.NONE)
+    if ImageChops.difference(palette.convert(img.mode), img).getbbox() is not None:
+        return None
+    return palette
+
+def _exact_grayscale(img):
+    """Buang kanal warna bila R, G dan B selalu sama (gambar abu-abu yang disimpan sebagai RGB)."""
+    if img.mode not in ("RGB", "RGBA"):
+        return None
+    from PIL import ImageChops
+
+    red, green, blue = img.getchannel("R"), img.getchannel("G"), img.getchannel("B")
+    if ImageChops.difference(red, green).getbbox() or ImageChops.difference(green, blue).getbbox():
+        return None
+    if img.mode == "RGBA":
+        return _pil_image().merge("LA", (red, img.getchannel("A")))
+    return red
+
+# Kandidat trial encode: nama -> (transformasi lossless atau None, argumen save).
+# "default" sama dengan hasil tanpa optimasi dan selalu ikut sebagai pembanding.
+OPTIMIZE_CANDIDATES = {
+    "default": (None, {}),
+    "optimize": (None, {"optimize": True}),
+    "palette": (_exact_palette, {"optimize": True}),
+    "grayscale": (_exact_grayscale, {"optimize": True}),
+    "lossy_m6": (None, {"quality": 80, "method": 6}),
+    "lossless_m4": (None, {"lossless": True, "quality": 80, "method": 4}),
+    "lossless_m6": (None, {"lossless": True, "quality": 100, "method": 6}),
+}
+# Tingkat upaya optimasi output PNG/WEBP (0 = mati). Tidak ada kandidat yang
+# menurunkan kualitas di bawah hasil default: PNG tetap lossless, WEBP lossy
+# memakai kualitas default Pillow (80) dengan method lebih lambat.
+OPTIMIZE_LEVELS = {
+    1: {"PNG": ["optimize"], "WEBP": ["lossy_m6"]},
+    2: {"PNG": ["optimize", "palette"], "WEBP": ["lossy_m6", "lossless_m4"]},
+    3: {"PNG": ["optimize", "palette", "grayscale"], "WEBP": ["lossy_m6", "lossless_m6"]},
 }
+OPTIMIZE_LEVEL_NAMES = {0: "Mati", 1: "Cepat", 2: "Seimbang", 3: "Maksimal"}
+OPTIMIZE_TIME_BUDGET = 10.0
+
+def _encode_candidate(img, to_format, name, metadata=None):
+    """Encode satu kandidat ke BytesIO; None bila kandidat tidak berlaku untuk gambar ini."""
+    transform, save_args = OPTIMIZE_CANDIDATES[name]
+    metadata = dict(metadata or {})
+    if transform is not None:
+        img = transform(img)
+        if img is None:
+            return None
+        if img.mode in ("L", "LA"):
+            # Profil ICC RGB tidak berlaku untuk gambar abu-abu.
+            metadata.pop("icc_profile", None)
+    buffer = io.BytesIO()
+    img.save(buffer, format=to_format, **save_args, **metadata)
+    return buffer
+
+def _optimized_encode(img, to_format, level, budget=OPTIMIZE_TIME_BUDGET, metadata=None):
+    """Jalankan trial encode berurutan dan ambil hasil terkecil.
+
+    Encode default selalu dijalankan lebih dulu sebagai pembanding. Kandidat
+    berikutnya hanya dimulai selama `budget` detik belum habis; encode yang
+    sedang berjalan tidak bisa dihentikan, jadi total waktu bisa melewati
+    budget paling banyak satu kandidat. Job sudah berjalan paralel di pool
+    proses, sehingga trial di dalam satu job tidak perlu thread sendiri.
+    Hanya buffer terbaik sejauh ini yang disimpan; kandidat yang kalah langsung
+    dibuang. Bila ukurannya sama, kandidat yang lebih awal di daftar (terutama
+    "default") yang dipilih. Mengembalikan `(buffer, info)` dengan info
+    kandidat terpilih dan byte yang dihemat.
+    """
+    names = ["default"] + OPTIMIZE_LEVELS[level].get(to_format, [])
+    deadline = time.perf_counter() + budget
+    best = None
+    choice = None
+    best_bytes = default_bytes = None
+    timed_out = []
+    for name in names:
+        if name != "default" and time.perf_counter() >= deadline:
+            timed_out.append(name)
+            continue
+        buffer = _encode_candidate(img, to_format, name, metadata)
+        if buffer is None:
+            continue
+        nbytes = buffer.getbuffer().nbytes
+        if name == "default":
+            default_bytes = nbytes
+        if best is None or nbytes < best_bytes:
+            best, choice, best_bytes = buffer, name, nbytes
+    return best, {
+        "choice": choice,
+        "bytes_default": default_bytes,
+        "bytes": best_bytes,
+        "saved": default_bytes - best_bytes,
+        "timed_out": timed_out,
+    }
+
+def _save_image(img, output_path, to_format, timer=None, fsync=False, optimize=0,
+                optimize_budget=OPTIMIZE_TIME_BUDGET, metadata=None):
+    """Encode gambar yang sudah didecode ke satu format tujuan.
+
+    `metadata` (dari `_image_metadata`) ditulis ke format yang mendukungnya
+    (`METADATA_FORMATS`). Dengan `optimize` (1-3) output PNG/WEBP dipilih dari
+    beberapa trial encode (lihat `OPTIMIZE_LEVELS`); mengembalikan info
+    optimasi atau None.
+    """
+    timer = timer or StageTimer()
+    metadata = metadata if to_format in METADATA_FORMATS else {}
+    if optimize and to_format in ("PNG", "WEBP"):
+        with timer.span("encode"):
+            buffer, info = _optimized_encode(img, to_format, optimize, optimize_budget, metadata)
+        with timer.span("write"):
+            write_output(buffer, output_path, fsync)
+        return info
+
+    with timer.span("transform"):
+        if to_format == "JPG":
+            if img.mode in ('RGBA', 'P'):
+                img = img.convert('RGB')
+            save_args = {"format": "JPEG", "quality": JPEG_OUTPUT_QUALITY}
+        elif to_format == "ICO":
+            # Satu kali downscale berkualitas tinggi ke ukuran dasar; semua ukuran
+            # ICO kemudian diturunkan Pillow dari gambar kecil ini, bukan dari resolusi penuh.
+            base_size = _ico_base_size(*img.size)
+            if base_size != img.size:
+                img = img.resize(base_size, _pil_image().Resampling.LANCZOS, reducing_gap=3.0)
+            save_args = {"format": "ICO", "sizes": ICO_SIZES}
+        else:
+            save_args = {"format": to_format.upper()}
+
+    with timer.span("encode"):
+        buffer = io.BytesIO()
+        img.save(buffer, **save_args, **(metadata or {}))
+    with timer.span("write"):
+        write_output(buffer, output_path, fsync)
+
+EXECUTOR_PROCESS = "process"
+EXECUTOR_THREAD = "thread"
+EXECUTOR_DOCX = "docx"
 
-def convert_file(input_path, output_path, from_format, to_format, category, target_size_kb=None):
-    """Fungsi dispatcher untuk memanggil metode konversi/kompresi yang benar."""
+class ConversionRoute:
+    """Satu rute konversi kategori/from→to beserta kemampuannya.
+
+    `executor` menentukan tempat job dijalankan: pool proses untuk pekerjaan
+    CPU-bound, pool thread untuk pekerjaan I/O-bound, atau `DocxPdfPool` untuk
+    backend office eksternal. Perkiraan memori kerja untuk budget memori
+    berasal dari `memory_estimator(job)` bila ada, selain itu `memory_factor`
+    kali ukuran file input. Rute `streaming` tidak memuat seluruh input ke
+    memori, jadi `memory_factor`-nya default 0 dan tidak pernah menahan job lain.
+    """
+
+    def __init__(self, category, from_format, to_format, converter, streaming=False, cpu_bound=True,
+                 memory_factor=None, memory_estimator=None, executor=None):
+        self.category = category
+        self.from_format = from_format
+        self.to_format = to_format
+        self.converter = converter
+        self.streaming = streaming
+        self.cpu_bound = cpu_bound
+        if memory_factor is None:
+            memory_factor = 0.0 if streaming else 1.0
+        self.memory_factor = memory_factor
+        self.memory_estimator = memory_estimator
+        self.executor = executor or (EXECUTOR_PROCESS if cpu_bound else EXECUTOR_THREAD)
+
+    def estimate_memory(self, job):
+        if self.memory_estimator is not None:
+            estimate = self.memory_estimator(job)
+            if estimate is not None:
+                return estimate
+        return int(_file_size(job["input_path"]) * self.memory_factor)
+
+CONVERTERS = {}
+
+def register_converter(category, from_format, to_formats, converter, extensions=None, **capabilities):
+    """Daftarkan `converter(job, timer)` untuk rute `from_format` -> setiap format di `to_formats`.
+
+    Converter menerima dict job (lihat `make_job`) dan `StageTimer`, lalu
+    mengembalikan dict detail tambahan. `CONVERSION_CONFIG` (dan pilihan di
+    GUI/CLI) ikut diperbarui, jadi format baru cukup didaftarkan di sini.
+    `capabilities` diteruskan ke `ConversionRoute`.
+    """
+    if isinstance(to_formats, str):
+        to_formats = [to_formats]
+    if extensions:
+        FORMAT_EXTENSIONS.setdefault(from_format, tuple(extensions))
+    config = CONVERSION_CONFIG.setdefault(category, {"formats": [], "output_map": {}})
+    if from_format not in config["formats"]:
+        config["formats"].append(from_format)
+    output_formats = config["output_map"].setdefault(from_format, [])
+    for to_format in to_formats:
+        CONVERTERS[(category, from_format, to_format)] = ConversionRoute(
+            category, from_format, to_format, converter, **capabilities
+        )
+        if to_format not in output_formats:
+            output_formats.append(to_format)
+
+def route_for(category, from_format, to_format):
+    """Cari rute terdaftar; `to_format` list (multi-output) memakai rute format pertama."""
+    if isinstance(to_format, (list, tuple)):
+        to_format = to_format[0]
+    route = CONVERTERS.get((category, from_format, to_format))
+    if route is None:
+        raise ValueError(f"Rute konversi tidak didukung: {category} {from_format} -> {to_format}")
+    return route
+
+def job_route(job):
+    return route_for(job["category"], job["from_format"], job["to_format"])
+
+# Format input "AUTO": format setiap file dideteksi dari isinya, bukan ekstensinya.
+AUTO_FORMAT = "AUTO"
+SNIFF_BYTES = 4096
+HEIF_BRANDS = (b"heic", b"heix", b"hevc", b"hevx", b"heim", b"heis", b"mif1", b"msf1")
+
+def _sniff_office(path):
     try:
-        if category == "Kompresi":
-            if from_format == "JPG":
-                target_bytes = int(target_size_kb) * 1024
-                with Image.open(input_path) as img:
-                    if img.mode in ('RGBA', 'P'):
-                        img = img.convert('RGB')
-                    
-                    low = 1
-                    high = 95
-                    best_quality = -1
-                    
-                    while low <= high:
-                        mid = (low + high) // 2
-                        buffer = io.BytesIO()
-                        img.save(buffer, "JPEG", quality=mid, optimize=True)
-                        size = buffer.tell()
-                        
-                        if size <= target_bytes:
-                            best_quality = mid
-                            low = mid + 1
-                        else:
-                            high = mid - 1
-
-                    if best_quality != -1:
-                        buffer = io.BytesIO()
-                        img.save(buffer, "JPEG", quality=best_quality, optimize=True)
-                        with open(output_path, 'wb') as f:
-                            f.write(buffer.getvalue())
-                    else:
-                        img.save(output_path, "JPEG", quality=1, optimize=True)
-
-        elif category == "Gambar":
-            with Image.open(input_path) as img:
-                if to_format == "JPG":
-                    if img.mode in ('RGBA', 'P'):
-                        img = img.convert('RGB')
-                    img.save(output_path, "JPEG", quality=95)
-                elif to_format == "ICO":
-                    icon_sizes = [(16,16), (32,32), (48,48), (64,64), (128,128), (256,256)]
-                    img.save(output_path, format='ICO', sizes=icon_sizes)
-                else:
-                    img.save(output_path, format=to_format.upper())
-        
-        elif category == "Dokumen":
-            if from_format == "DOCX" and to_format == "PDF":
-                docx_to_pdf(input_path, output_path)
-            elif from_format == "XLSX" and to_format == "CSV":
-                pd.read_excel(input_path).to_csv(output_path, index=False)
-            elif from_format == "CSV" and to_format == "XLSX":
-                pd.read_csv(input_path).to_excel(output_path, index=False)
+        with zipfile.ZipFile(path) as archive:
+            names = set(archive.namelist())
+    except (OSError, zipfile.BadZipFile):
+        return None
+    if "word/document.xml" in names:
+        return "DOCX"
+    if "xl/workbook.xml" in names:
+        return "XLSX"
+    return None
+
+def _looks_like_text(head):
+    if b"\x00" in head:
+        return False
+    try:
+        head.decode("utf-8")
+    except UnicodeDecodeError as e:
+        # Karakter multi-byte yang terpotong di ujung buffer masih dianggap teks.
+        return e.start >= len(head) - 3
+    return True
 
+CSV_SNIFF_DELIMITERS = ",;\t|"
+
+def _looks_like_csv(head, path):
+    """CSV tidak punya magic bytes, jadi teks hanya dianggap CSV bila berekstensi
+    .csv atau semua baris contohnya punya delimiter dan jumlah kolom (≥2) yang sama.
+    """
+    if os.path.splitext(path)[1].lower() in FORMAT_EXTENSIONS["CSV"]:
         return True
+    lines = head.decode("utf-8", errors="ignore").splitlines()
+    if len(head) >= SNIFF_BYTES:
+        # Baris terakhir kemungkinan terpotong di batas buffer.
+        lines = lines[:-1]
+    lines = [line for line in lines if line.strip()]
+    if len(lines) < 2:
+        return False
+    try:
+        dialect = csv.Sniffer().sniff("\n".join(lines), delimiters=CSV_SNIFF_DELIMITERS)
+    except csv.Error:
+        return False
+    widths = {len(row) for row in csv.reader(lines, dialect)}
+    return len(widths) == 1 and min(widths) >= 2
 
-    except Exception:
+def sniff_format(path):
+    """Deteksi format file dari magic bytes; None bila tidak dikenali.
+
+    Teks UTF-8 tanpa byte NUL hanya dianggap CSV bila lolos `_looks_like_csv`,
+    sehingga JSON, catatan teks dan sejenisnya masuk daftar yang dilewati.
+    """
+    try:
+        with open(path, "rb") as f:
+            head = f.read(SNIFF_BYTES)
+    except OSError:
+        return None
+    if head.startswith(b"\xff\xd8\xff"):
+        return "JPG"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "PNG"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "WEBP"
+    if head[4:8] == b"ftyp" and head[8:12] in HEIF_BRANDS:
+        return "HEIC"
+    if head.startswith(b"PK\x03\x04"):
+        return _sniff_office(path)
+    if head and _looks_like_text(head) and _looks_like_csv(head, path):
+        return "CSV"
+    return None
+
+# Salinan gambar penuh yang bisa hidup bersamaan (hasil decode + hasil convert/resize).
+IMAGE_WORKING_COPIES = 2
+
+def _image_memory_estimate(job):
+    """Perkiraan memori decode dari header saja: lebar × tinggi × byte per piksel.
+
+    Pillow menyimpan gambar multi-band sebagai 4 byte per piksel. Mengembalikan
+    None bila header tidak terbaca sehingga `memory_factor` dipakai.
+    """
+    try:
+        with _pil_image(heif=job["from_format"] == "HEIC").open(job["input_path"]) as img:
+            width, height = img.size
+            mode = img.mode
+    except (OSError, ValueError):
+        return None
+    if mode in ("1", "L", "P"):
+        bytes_per_pixel = 1
+    elif mode.startswith("I;16"):
+        bytes_per_pixel = 2
+    else:
+        bytes_per_pixel = 4
+    return width * height * bytes_per_pixel * IMAGE_WORKING_COPIES
+
+def _fits_without_encode(job, target_bytes):
+    """True bila input sudah JPEG di bawah target dan tidak perlu diperkecil, jadi cukup disalin."""
+    if job.get("strip_metadata") or _file_size(job["input_path"]) > target_bytes:
         return False
+    if sniff_format(job["input_path"]) != "JPG":
+        return False
+    if not job["max_dimension"]:
+        return True
+    try:
+        # Image.open hanya membaca header; piksel tidak didecode.
+        with _pil_image().open(job["input_path"]) as img:
+            return max(img.size) <= int(job["max_dimension"])
+    except (OSError, ValueError):
+        return False
+
+def _convert_compress_jpeg(job, timer):
+    Image = _pil_image()
+    details = {}
+    target_bytes = int(job["target_size_kb"]) * 1024
+    if _fits_without_encode(job, target_bytes):
+        with timer.span("write"):
+            copy_output(job["input_path"], job["output_path"], job["fsync"])
+        details["copied"] = True
+        return details
+    with timer.span("decode"):
+        img = Image.open(job["input_path"])
+    with img:
+        img = _load_image(img, ["JPG"], job["max_dimension"], timer)
+        metadata = _image_metadata(img, job.get("strip_metadata", False))
+        with timer.span("transform"):
+            if img.mode in ('RGBA', 'P'):
+                img = img.convert('RGB')
+        with timer.span("encode"):
+            buffer, details["quality"] = compress_jpeg_to_target(img, target_bytes, metadata=metadata)
+        with timer.span("write"):
+            write_output(buffer, job["output_path"], job["fsync"])
+    return details
+
+def _convert_image(job, timer):
+    # Gambar hanya didecode sekali lalu di-encode ke semua format tujuan.
+    Image = _pil_image(heif=job["from_format"] == "HEIC")
+    targets = job_outputs(job["to_format"], job["output_path"])
+    details = {}
+    with timer.span("decode"):
+        img = Image.open(job["input_path"])
+    with img:
+        img = _load_image(img, [target_format for target_format, _ in targets], job["max_dimension"], timer)
+        metadata = _image_metadata(img, job.get("strip_metadata", False))
+        for target_format, target_path in targets:
+            info = _save_image(
+                img, target_path, target_format, timer, job["fsync"],
+                optimize=job.get("optimize", 0), optimize_budget=job.get("optimize_budget", OPTIMIZE_TIME_BUDGET),
+                metadata=metadata
+            )
+            if info is not None:
+                details.setdefault("optimize", {})[target_format] = info
+    if "optimize" in details:
+        details["bytes_saved"] = sum(info["saved"] for info in details["optimize"].values())
+    return details
+
+# Jalur dokumen membaca, mengubah dan menulis secara streaming sehingga
+# dicatat sebagai satu tahap "convert".
+def _convert_xlsx_to_csv(job, timer):
+    with timer.span("convert"):
+        return stream_xlsx_to_csv(
+            job["input_path"], job["output_path"], job["fsync"],
+            sheets=job.get("sheets"), dtypes=job.get("dtypes"), engine=job.get("xlsx_engine") or "auto"
+        )
+
+def _convert_csv_to_xlsx(job, timer):
+    with timer.span("convert"):
+        return stream_csv_to_xlsx(job["input_path"], job["output_path"], job["fsync"], dtypes=job.get("dtypes"))
+
+def _convert_csv_to_arrow(job, timer):
+    with timer.span("convert"):
+        return stream_csv_to_arrow(
+            job["input_path"], job["output_path"], job["to_format"], job["fsync"], dtypes=job.get("dtypes")
+        )
+
+def _convert(job, timer):
+    """Jalankan converter dari rute terdaftar; mengembalikan dict detail tambahan."""
+    return job_route(job).converter(job, timer)
+
+DOCX_BACKENDS = ("word", "libreoffice", "docx2pdf")
+DOCX_POOL_WORKERS = 2
+DOCX_BATCH_SIZE = 20
+# Batas waktu satu proses soffice: per dokumen dalam batch, supaya soffice yang macet tidak menahan pool.
+DOCX_TIMEOUT_PER_FILE = 120
+WORD_PDF_FORMAT = 17
+LIBREOFFICE_CANDIDATES = [
+    "soffice",
+    "libreoffice",
+    r"C:\Program Files\LibreOffice\program\soffice.exe",
+    "/Applications/LibreOffice.app/Contents/MacOS/soffice",
+]
+
+def _find_soffice():
+    for candidate in LIBREOFFICE_CANDIDATES:
+        path = shutil.which(candidate) or (candidate if os.path.isfile(candidate) else None)
+        if path:
+            return path
+    return None
+
+def detect_docx_backend():
+    """Pilih backend DOCX→PDF: Word (Windows), LibreOffice headless, atau docx2pdf."""
+    if os.name == "nt":
+        try:
+            import win32com.client  # noqa: F401
+            return "word"
+        except ImportError:
+            pass
+    if _find_soffice():
+        return "libreoffice"
+    return "docx2pdf"
+
+class _WordSession:
+    """Satu instance Microsoft Word yang dipakai ulang untuk banyak dokumen."""
+
+    def __init__(self):
+        import pythoncom
+        import win32com.client
+        pythoncom.CoInitialize()
+        self.word = win32com.client.DispatchEx("Word.Application")
+        self.word.Visible = False
+        self.word.DisplayAlerts = 0
+
+    def convert(self, pairs, fsync=False):
+        errors = []
+        for input_path, output_path in pairs:
+            try:
+                document = self.word.Documents.Open(os.path.abspath(input_path), ReadOnly=True)
+                try:
+                    with atomic_output(output_path, fsync) as temp_path:
+                        document.SaveAs(os.path.abspath(temp_path), FileFormat=WORD_PDF_FORMAT)
+                finally:
+                    document.Close(0)
+                errors.append(None)
+            except Exception as e:
+                errors.append(e)
+        return errors
+
+    def close(self):
+        import pythoncom
+        try:
+            self.word.Quit()
+        finally:
+            pythoncom.CoUninitialize()
+
+class _LibreOfficeSession:
+    """LibreOffice headless dengan profil sendiri per worker; satu proses per batch dokumen."""
+
+    def __init__(self):
+        self.soffice = _find_soffice()
+        if self.soffice is None:
+            raise RuntimeError("LibreOffice (soffice) tidak ditemukan.")
+        self.profile_dir = tempfile.mkdtemp(prefix="converter_lo_profile_")
+
+    def _run(self, pairs, fsync):
+        with tempfile.TemporaryDirectory(prefix="converter_lo_out_") as out_dir:
+            command = [
+                self.soffice, f"-env:UserInstallation={pathlib.Path(self.profile_dir).as_uri()}",
+                "--headless", "--norestore", "--convert-to", "pdf", "--outdir", out_dir,
+            ] + [os.path.abspath(input_path) for input_path, _ in pairs]
+            timeout = DOCX_TIMEOUT_PER_FILE * len(pairs)
+            try:
+                result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=timeout)
+                failure = RuntimeError(
+                    f"LibreOffice tidak menghasilkan PDF (exit {result.returncode}) "
+                    f"{result.stderr.decode(errors='replace').strip()}".strip()
+                )
+            except subprocess.TimeoutExpired:
+                failure = TimeoutError(f"LibreOffice tidak selesai dalam {timeout} detik.")
+                # Proses yang dibunuh bisa meninggalkan lock di profil; mulai dengan profil baru.
+                shutil.rmtree(self.profile_dir, ignore_errors=True)
+                self.profile_dir = tempfile.mkdtemp(prefix="converter_lo_profile_")
+            errors = []
+            for input_path, output_path in pairs:
+                produced = os.path.join(out_dir, os.path.splitext(os.path.basename(input_path))[0] + ".pdf")
+                if os.path.isfile(produced):
+                    with atomic_output(output_path, fsync) as temp_path:
+                        shutil.move(produced, temp_path)
+                    errors.append(None)
+                else:
+                    errors.append(failure)
+            return errors
+
+    def convert(self, pairs, fsync=False):
+        # File dengan nama dasar sama akan saling menimpa di --outdir, jadi dipisah ke batch berbeda.
+        errors = {}
+        remaining = list(pairs)
+        while remaining:
+            batch, seen, rest = [], set(), []
+            for pair in remaining:
+                stem = os.path.splitext(os.path.basename(pair[0]))[0].lower()
+                (rest if stem in seen else batch).append(pair)
+                seen.add(stem)
+            for pair, error in zip(batch, self._run(batch, fsync)):
+                errors[id(pair)] = error
+            remaining = rest
+        return [errors[id(pair)] for pair in pairs]
+
+    def close(self):
+        shutil.rmtree(self.profile_dir, ignore_errors=True)
+
+class _Docx2PdfSession:
+    """Fallback: satu panggilan docx2pdf per dokumen."""
+
+    def convert(self, pairs, fsync=False):
+        from docx2pdf import convert as docx_to_pdf
+        errors = []
+        for input_path, output_path in pairs:
+            try:
+                with atomic_output(output_path, fsync) as temp_path:
+                    docx_to_pdf(input_path, temp_path)
+                errors.append(None)
+            except Exception as e:
+                errors.append(e)
+        return errors
+
+    def close(self):
+        pass
+
+def open_docx_session(backend=None):
+    backend = backend or detect_docx_backend()
+    if backend == "word":
+        return _WordSession()
+    if backend == "libreoffice":
+        return _LibreOfficeSession()
+    return _Docx2PdfSession()
+
+def _close_docx_session(session):
+    # Sesi yang sudah rusak boleh gagal saat ditutup; jangan sampai mematikan worker.
+    if session is None:
+        return
+    try:
+        session.close()
+    except Exception:
+        pass
+
+def _convert_docx_to_pdf(job, timer):
+    with timer.span("convert"):
+        session = open_docx_session()
+        try:
+            error = session.convert([(job["input_path"], job["output_path"])], job["fsync"])[0]
+        finally:
+            session.close()
+    if error is not None:
+        raise error
+    return {}
+
+class DocxPdfPool:
+    """Pool worker DOCX→PDF yang hidup lama.
+
+    Setiap worker thread membuka satu sesi backend (Word atau profil
+    LibreOffice) dan memakainya untuk semua batch yang diterima, sehingga
+    biaya start-up aplikasi office tidak dibayar per dokumen. Dipakai sebagai
+    context manager; `submit` bisa dipanggil berkali-kali sebelum `close`.
+    """
+
+    def __init__(self, workers=DOCX_POOL_WORKERS, backend=None, batch_size=DOCX_BATCH_SIZE):
+        self.workers = max(1, workers)
+        self.backend = backend or detect_docx_backend()
+        self.batch_size = max(1, batch_size)
+        self.tasks = queue.Queue()
+        self.threads = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def submit(self, jobs, on_record):
+        """Antrekan job DOCX; `on_record(job, record)` dipanggil dari thread worker."""
+        chunks = [jobs[i:i + self.batch_size] for i in range(0, len(jobs), self.batch_size)]
+        for chunk in chunks:
+            self.tasks.put((chunk, on_record))
+        for _ in range(min(self.workers - len(self.threads), len(chunks))):
+            thread = threading.Thread(target=self._worker, daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def join(self):
+        self.tasks.join()
+
+    def close(self):
+        for _ in self.threads:
+            self.tasks.put(None)
+        for thread in self.threads:
+            thread.join()
+        self.threads = []
+
+    def _worker(self):
+        session = None
+        while True:
+            item = self.tasks.get()
+            if item is None:
+                self.tasks.task_done()
+                break
+            chunk, on_record = item
+            try:
+                session = self._convert_chunk(session, chunk, on_record)
+            finally:
+                self.tasks.task_done()
+        _close_docx_session(session)
+
+    def _convert_chunk(self, session, chunk, on_record):
+        """Konversi satu chunk dan kirim catatan untuk setiap job; mengembalikan sesi untuk chunk berikutnya.
+
+        Bila membuka sesi atau `convert` melempar exception (COM Word error,
+        LibreOffice gagal start, dst.), semua job di chunk dicatat gagal dan
+        sesinya ditutup; chunk berikutnya membuka sesi baru.
+        """
+        start = time.perf_counter()
+        try:
+            if session is None:
+                session = open_docx_session(self.backend)
+            errors = session.convert(
+                [(job["input_path"], job["output_path"]) for job in chunk],
+                any(job.get("fsync") for job in chunk)
+            )
+        except Exception as e:
+            errors = [e] * len(chunk)
+            _close_docx_session(session)
+            session = None
+        # Satu proses menangani seluruh batch, jadi durasinya dibagi rata per file.
+        seconds = (time.perf_counter() - start) / len(chunk)
+        for job, error in zip(chunk, errors):
+            record = _new_record(**job)
+            record["ok"] = error is None
+            if error is not None:
+                record["error_type"] = type(error).__name__
+                record["error"] = str(error)
+            timer = StageTimer()
+            timer.spans["convert"] = seconds
+            _finish_record(record, timer, time.perf_counter() - seconds)
+            on_record(job, record)
+        return session
+
+# Rute bawaan. Urutan pendaftaran menentukan urutan pilihan di GUI.
+register_converter("Kompresi", "JPG", "JPG (Kualitas Dikompresi)", _convert_compress_jpeg,
+                   memory_estimator=_image_memory_estimate, memory_factor=12.0)
+register_converter("Gambar", "HEIC", ["JPG", "PNG"], _convert_image,
+                   memory_estimator=_image_memory_estimate, memory_factor=12.0)
+register_converter("Gambar", "JPG", ["PNG", "WEBP", "ICO"], _convert_image,
+                   memory_estimator=_image_memory_estimate, memory_factor=12.0)
+register_converter("Gambar", "PNG", ["JPG", "WEBP", "ICO"], _convert_image,
+                   memory_estimator=_image_memory_estimate, memory_factor=4.0)
+register_converter("Gambar", "WEBP", ["JPG", "PNG"], _convert_image,
+                   memory_estimator=_image_memory_estimate, memory_factor=12.0)
+register_converter(
+    "Dokumen", "DOCX", "PDF", _convert_docx_to_pdf,
+    cpu_bound=False, memory_factor=0.0, executor=EXECUTOR_DOCX
+)
+register_converter("Dokumen", "XLSX", "CSV", _convert_xlsx_to_csv, streaming=True)
+register_converter("Dokumen", "CSV", "XLSX", _convert_csv_to_xlsx, streaming=True)
+# Output kolumnar untuk analitik hanya tersedia bila pyarrow terpasang.
+if importlib.util.find_spec("pyarrow"):
+    register_converter("Dokumen", "CSV", ["PARQUET", "FEATHER"], _convert_csv_to_arrow, streaming=True)
+
+def _file_size(path):
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+def _new_record(input_path, output_path, from_format, to_format, category, **_):
+    return {
+        "input_path": input_path,
+        "output_path": output_path,
+        "category": category,
+        "from_format": from_format,
+        "to_format": to_format,
+        "ok": False,
+        "cached": False,
+        "resumed": False,
+        "error_type": None,
+        "error": None,
+        "bytes_in": _file_size(input_path),
+        "bytes_out": 0,
+        "seconds": 0.0,
+        "spans": {},
+        "details": {},
+    }
+
+def _finish_record(record, timer, start):
+    record["seconds"] = round(time.perf_counter() - start, 4)
+    record["spans"] = {name: round(seconds, 4) for name, seconds in timer.spans.items()}
+    if record["ok"]:
+        record["bytes_out"] = sum(_file_size(path) for _, path in job_outputs(record["to_format"], record["output_path"]))
+    return record
+
+def convert_file_report(input_path, output_path, from_format, to_format, category, target_size_kb=None,
+                        max_dimension=None, fsync=False, **options):
+    """Seperti `convert_file`, tetapi mengembalikan catatan terstruktur per file.
+
+    Catatan berisi status, tipe dan pesan exception bila gagal, ukuran byte
+    masuk/keluar, total durasi, durasi per tahap (`spans`) dan detail
+    tambahan seperti kualitas JPEG atau jumlah baris.
+    """
+    record = _new_record(input_path, output_path, from_format, to_format, category)
+    timer = StageTimer()
+    start = time.perf_counter()
+    try:
+        record["details"] = _convert({
+            "input_path": input_path,
+            "output_path": output_path,
+            "from_format": from_format,
+            "to_format": to_format,
+            "category": category,
+            "target_size_kb": target_size_kb,
+            "max_dimension": max_dimension,
+            "fsync": fsync,
+            **options,
+        }, timer)
+        record["ok"] = True
+    except Exception as e:
+        record["error_type"] = type(e).__name__
+        record["error"] = str(e)
+    return _finish_record(record, timer, start)
+
+def convert_file(input_path, output_path, from_format, to_format, category, target_size_kb=None,
+                 max_dimension=None, fsync=False, **options):
+    """Fungsi dispatcher untuk memanggil metode konversi/kompresi yang benar.
+
+    `max_dimension` (px) opsional memperkecil gambar agar sisi terpanjangnya
+    tidak melebihi nilai tersebut. Semua output ditulis atomik (file sementara
+    lalu rename); `fsync` memaksa data ke disk sebelum rename. Mengembalikan
+    True bila berhasil; gunakan `convert_file_report` untuk detail kegagalan
+    dan timing. `options` adalah opsi khusus rute (mis. `sheets`, `dtypes`,
+    `xlsx_engine` untuk XLSX→CSV).
+    """
+    return convert_file_report(
+        input_path, output_path, from_format, to_format, category,
+        target_size_kb=target_size_kb, max_dimension=max_dimension, fsync=fsync, **options
+    )["ok"]
+
+def build_output_path(input_path, output_folder, category, to_format):
+    """Tentukan path file output berdasarkan kategori dan format tujuan."""
+    filename = os.path.basename(input_path)
+    if category == "Kompresi":
+        base, ext = os.path.splitext(filename)
+        output_filename = f"{base}_terkompresi{ext}"
+    else:
+        output_filename = os.path.splitext(filename)[0] + f".{to_format.lower()}"
+    return os.path.join(output_folder, output_filename)
+
+# Pengaturan encoder yang ikut menentukan hasil konversi. Setiap perubahan di
+# sini otomatis membuat entri cache lama tidak terpakai lagi.
+CACHE_FORMAT_VERSION = 4
+ENCODER_SETTINGS = {
+    "jpeg_quality": JPEG_OUTPUT_QUALITY,
+    "ico_sizes": ICO_SIZES,
+    "proxy_max_pixels": PROXY_MAX_PIXELS,
+    "max_full_encodes": MAX_FULL_ENCODES,
+    "optimize_candidates": {name: save_args for name, (_, save_args) in OPTIMIZE_CANDIDATES.items()},
+    "optimize_levels": OPTIMIZE_LEVELS,
+    "metadata_formats": METADATA_FORMATS,
+}
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "converter_file"
+)
+DEFAULT_CACHE_MAX_MB = 1024
+HASH_CHUNK_SIZE = 1024 * 1024
+
+class ConversionCache:
+    """Cache hasil konversi di disk, dikunci oleh hash isi file input + pengaturan.
+
+    Entri yang jarang dipakai dihapus (LRU berdasarkan mtime) ketika total
+    ukuran cache melebihi `max_bytes`. Hit cache cukup disalin atau di-hardlink
+    ke folder output tanpa konversi ulang.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_CACHE_MAX_MB * 1024 * 1024, use_hardlinks=False):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.use_hardlinks = use_hardlinks
+
+    def keys_for(self, job):
+        """Hitung kunci cache untuk setiap output job; mengembalikan list `(key, output_path)`."""
+        digest = hashlib.sha256()
+        with open(job["input_path"], "rb") as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        settings = {name: value for name, value in job.items() if name not in ("input_path", "output_path", "to_format", "fsync")}
+        if job["from_format"] == "XLSX":
+            # "auto" bisa berarti engine berbeda di tiap mesin.
+            settings["xlsx_engine"] = resolve_xlsx_engine(job.get("xlsx_engine"))
+        settings["encoder"] = ENCODER_SETTINGS
+        settings["version"] = CACHE_FORMAT_VERSION
+        digest.update(json.dumps(settings, sort_keys=True, default=str).encode("utf-8"))
+        base_key = digest.hexdigest()
+        return [
+            (hashlib.sha256(f"{base_key}:{index}:{target_format}".encode("utf-8")).hexdigest(), target_path)
+            for index, (target_format, target_path) in enumerate(job_outputs(job["to_format"], job["output_path"]))
+        ]
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def _place(self, source, destination):
+        """Salin/hardlink `source` ke `destination` lewat file sementara lalu rename."""
+        with atomic_output(destination) as temp_path:
+            if self.use_hardlinks:
+                os.remove(temp_path)
+                try:
+                    os.link(source, temp_path)
+                    return
+                except OSError:
+                    pass
+            shutil.copyfile(source, temp_path)
+
+    def fetch(self, key, output_path):
+        entry = self._entry_path(key)
+        if not os.path.isfile(entry):
+            return False
+        os.utime(entry)
+        self._place(entry, output_path)
+        return True
+
+    def store(self, key, output_path):
+        self._place(output_path, self._entry_path(key))
+
+    def evict(self):
+        """Hapus entri paling lama tidak dipakai sampai ukuran cache di bawah batas."""
+        entries = []
+        total = 0
+        for folder, _, filenames in os.walk(self.cache_dir):
+            for filename in filenames:
+                if filename.startswith("."):
+                    continue
+                path = os.path.join(folder, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+MANIFEST_NAME = ".konversi_manifest.jsonl"
+
+def _input_stat(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+class JobManifest:
+    """Manifest batch (JSON-lines) di folder output agar batch yang terputus bisa dilanjutkan.
+
+    Saat batch dimulai setiap job ditulis sebagai baris `job` beserta ukuran
+    dan mtime input; setiap file yang berhasil menambah baris `done`. Dengan
+    `resume=True`, job yang sudah `done`, inputnya tidak berubah dan semua
+    outputnya masih ada akan dilewati. Manifest dihapus setelah batch selesai
+    tanpa kegagalan.
+    """
+
+    def __init__(self, output_folder, resume=False):
+        self.path = os.path.join(output_folder, MANIFEST_NAME)
+        self.resume = resume
+        self.entries = {}
+        self.done = set()
+        self.file = None
+
+    @staticmethod
+    def job_key(job):
+        settings = {name: value for name, value in job.items() if name != "fsync"}
+        settings["input_path"] = os.path.abspath(job["input_path"])
+        return hashlib.sha1(json.dumps(settings, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def load(self):
+        """Baca manifest yang ada; baris terpotong akibat crash saat menulis diabaikan."""
+        self.entries = {}
+        self.done = set()
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if entry.get("type") == "job":
+                        self.entries[entry["key"]] = entry
+                        self.done.discard(entry["key"])
+                    elif entry.get("type") == "done":
+                        self.done.add(entry["key"])
+        except OSError:
+            pass
+        return self
+
+    def jobs(self):
+        return [entry["job"] for entry in self.entries.values()]
+
+    def unfinished_count(self):
+        return sum(1 for key in self.entries if key not in self.done)
+
+    def is_complete(self, key, job):
+        """Cek murah (stat saja) apakah job sudah selesai dan hasilnya masih berlaku."""
+        entry = self.entries.get(key)
+        if entry is None or key not in self.done:
+            return False
+        if _input_stat(job["input_path"]) != entry["stat"]:
+            return False
+        return all(os.path.exists(path) for _, path in job_outputs(job["to_format"], job["output_path"]))
+
+    def begin(self, jobs):
+        """Tulis ulang manifest untuk `jobs` dan buka untuk append; mengembalikan job yang dilewati."""
+        if self.resume:
+            self.load()
+        completed = []
+        with atomic_output(self.path) as temp_path:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                for job in jobs:
+                    key = self.job_key(job)
+                    if self.resume and self.is_complete(key, job):
+                        completed.append(job)
+                        stat = self.entries[key]["stat"]
+                    else:
+                        stat = _input_stat(job["input_path"])
+                    f.write(json.dumps({"type": "job", "key": key, "stat": stat, "job": job}, default=str) + "\n")
+                for job in completed:
+                    f.write(json.dumps({"type": "done", "key": self.job_key(job)}) + "\n")
+        self.file = open(self.path, "a", encoding="utf-8")
+        return completed
+
+    def mark(self, job, record):
+        """Catat job yang berhasil; di-flush langsung agar tetap tercatat bila aplikasi ditutup."""
+        if self.file is None or not record["ok"]:
+            return
+        self.file.write(json.dumps({"type": "done", "key": self.job_key(job)}) + "\n")
+        self.file.flush()
+
+    def close(self, remove=False):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        if remove and os.path.exists(self.path):
+            os.remove(self.path)
+
+def _init_worker():
+    """Worker pool mengabaikan Ctrl+C; proses utama yang menghentikan batch dengan rapi."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+def _fetch_cached(job, cache):
+    """Coba ambil hasil job dari cache; mengembalikan `(record_atau_None, entries)`."""
+    if cache is None:
+        return None, []
+    timer = StageTimer()
+    start = time.perf_counter()
+    try:
+        with timer.span("cache"):
+            entries = cache.keys_for(job)
+            hit = all(cache.fetch(key, output_path) for key, output_path in entries)
+    except OSError:
+        return None, []
+    if not hit:
+        return None, entries
+    record = _new_record(**job)
+    record["ok"] = True
+    record["cached"] = True
+    return _finish_record(record, timer, start), entries
+
+def _store_cached(record, entries, cache):
+    if cache is None or not record["ok"]:
+        return
+    for key, output_path in entries:
+        try:
+            cache.store(key, output_path)
+        except OSError:
+            pass
+
+def _convert_job(job, cache=None):
+    """Jalankan satu job konversi (dipanggil di dalam worker process).
+
+    Mengembalikan catatan dari `convert_file_report`; `cached` bernilai True
+    bila hasil diambil dari cache.
+    """
+    record, entries = _fetch_cached(job, cache)
+    if record is not None:
+        return record
+    record = convert_file_report(**job)
+    _store_cached(record, entries, cache)
+    return record
+
+def _physical_memory():
+    """Total RAM fisik dalam byte, atau None bila tidak bisa dibaca."""
+    if sys.platform == "win32":
+        import ctypes
+
+        class MemoryStatus(ctypes.Structure):
+            _fields_ = [
+                ("dwLength", ctypes.c_ulong),
+                ("dwMemoryLoad", ctypes.c_ulong),
+                ("ullTotalPhys", ctypes.c_ulonglong),
+                ("ullAvailPhys", ctypes.c_ulonglong),
+                ("ullTotalPageFile", ctypes.c_ulonglong),
+                ("ullAvailPageFile", ctypes.c_ulonglong),
+                ("ullTotalVirtual", ctypes.c_ulonglong),
+                ("ullAvailVirtual", ctypes.c_ulonglong),
+                ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+            ]
+
+        status = MemoryStatus()
+        status.dwLength = ctypes.sizeof(MemoryStatus)
+        if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+            return status.ullTotalPhys
+        return None
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+def resolve_memory_budget(memory_budget_mb=None):
+    """Budget memori dalam byte: None = otomatis (sebagian RAM fisik), 0 = tanpa batas."""
+    if memory_budget_mb is None:
+        total = _physical_memory()
+        return int(total * DEFAULT_MEMORY_FRACTION) if total else None
+    if memory_budget_mb <= 0:
+        return None
+    return int(memory_budget_mb) * 1024 * 1024
+
+def _future_record(job, future):
+    try:
+        return future.result()
+    except Exception as e:
+        record = _new_record(**job)
+        record["error_type"] = type(e).__name__
+        record["error"] = str(e)
+        return record
+
+def _run_admitted(executors, jobs, cache, slots, budget, on_record):
+    """Jalankan job di executor sesuai rutenya tanpa melebihi budget memori.
+
+    Job hanya dikirim bila executor-nya masih punya slot kosong dan total
+    perkiraan memori job yang sedang berjalan masih muat dalam `budget`.
+    Job yang tidak muat dilewati sementara sehingga job lebih kecil di
+    belakangnya tetap bisa jalan; satu job selalu boleh jalan sendirian
+    walaupun perkiraannya melebihi budget. Mengembalikan puncak perkiraan memori.
+    """
+    pending = [
+        (job, job_route(job).executor, job_route(job).estimate_memory(job) if budget else 0)
+        for job in jobs
+    ]
+    running = {}
+    busy = dict.fromkeys(executors, 0)
+    used = 0
+    peak = 0
+    while pending or running:
+        index = 0
+        while index < len(pending):
+            job, executor_name, cost = pending[index]
+            if busy[executor_name] >= slots or (running and budget and used + cost > budget):
+                index += 1
+                continue
+            del pending[index]
+            future = executors[executor_name].submit(_convert_job, job, cache)
+            running[future] = (job, executor_name, cost)
+            busy[executor_name] += 1
+            used += cost
+            peak = max(peak, used)
+        done, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in done:
+            job, executor_name, cost = running.pop(future)
+            busy[executor_name] -= 1
+            used -= cost
+            on_record(job, _future_record(job, future))
+    return peak
+
+def summarize_records(records, slowest=5):
+    """Ringkas catatan per file: total per tahap, byte masuk/keluar, kegagalan dan file terlambat."""
+    stage_totals = {}
+    for record in records:
+        for name, seconds in record["spans"].items():
+            stage_totals[name] = round(stage_totals.get(name, 0.0) + seconds, 4)
+    return {
+        "stage_totals": stage_totals,
+        "bytes_in": sum(record["bytes_in"] for record in records),
+        "bytes_out": sum(record["bytes_out"] for record in records),
+        "bytes_saved": sum(record["details"].get("bytes_saved", 0) for record in records),
+        "copied": sum(1 for record in records if record["details"].get("copied")),
+        "failures": [
+            {"input_path": record["input_path"], "error_type": record["error_type"], "error": record["error"]}
+            for record in records if not record["ok"]
+        ],
+        "slowest": [
+            {"input_path": record["input_path"], "seconds": record["seconds"], "spans": record["spans"]}
+            for record in sorted(records, key=lambda record: record["seconds"], reverse=True)[:slowest]
+        ],
+    }
+
+def run_batch(jobs, workers=None, on_progress=None, cache=None, log_path=None, docx_backend=None, manifest=None,
+              memory_budget_mb=None):
+    """Jalankan daftar job konversi secara paralel menggunakan process pool.
+
+    Setiap job adalah dict berisi argumen untuk `convert_file`. Callback
+    `on_progress(done, total, job, record)` dipanggil setiap kali satu file
+    selesai dengan catatan dari `convert_file_report`. Bila `cache`
+    (ConversionCache) diberikan, file yang sudah pernah dikonversi dengan
+    pengaturan sama diambil langsung dari cache. Bila `log_path` diberikan,
+    setiap catatan ditulis sebagai satu baris JSON, diakhiri baris ringkasan.
+    Job DOCX→PDF dikirim ke `DocxPdfPool` dan berjalan bersamaan dengan pool proses.
+    Bila `manifest` (JobManifest) diberikan, status setiap job dicatat ke disk
+    dan job yang sudah selesai pada run sebelumnya dilaporkan dengan `resumed`.
+    Job pool proses/thread hanya dijalankan bersamaan selama total perkiraan
+    memorinya (dari header gambar) muat dalam `memory_budget_mb` (None =
+    otomatis, 0 = tanpa batas).
+    """
+    workers = max(1, int(workers or DEFAULT_WORKERS))
+    memory_budget = resolve_memory_budget(memory_budget_mb)
+    peak_memory = 0
+    total_files = len(jobs)
+    records = []
+    lock = threading.Lock()
+
+    completed = manifest.begin(jobs) if manifest is not None else []
+    if completed:
+        completed_ids = {id(job) for job in completed}
+        jobs = [job for job in jobs if id(job) not in completed_ids]
+
+    # Setiap rute menentukan executor-nya sendiri sehingga batch campuran
+    # dibagi ke pool proses, pool thread dan pool DOCX sekaligus.
+    # Job terbesar dikirim lebih dulu agar file besar tidak menjadi ekor batch.
+    groups = {}
+    for job in sorted(jobs, key=lambda job: _file_size(job["input_path"]), reverse=True):
+        groups.setdefault(job_route(job).executor, []).append(job)
+    docx_jobs = groups.get(EXECUTOR_DOCX, [])
+    process_jobs = groups.get(EXECUTOR_PROCESS, [])
+    thread_jobs = groups.get(EXECUTOR_THREAD, [])
+
+    start_time = time.time()
+    log_file = open(log_path, "a", encoding="utf-8") if log_path else None
+
+    def _record(job, record):
+        with lock:
+            records.append(record)
+            if log_file:
+                log_file.write(json.dumps(dict(record, type="file"), default=str) + "\n")
+            if manifest is not None and not record["resumed"]:
+                manifest.mark(job, record)
+            if on_progress:
+                on_progress(len(records), total_files, job, record)
+
+    docx_pool = None
+    clean_finish = False
+    try:
+        for job in completed:
+            record = _new_record(**job)
+            record["ok"] = True
+            record["resumed"] = True
+            _record(job, _finish_record(record, StageTimer(), time.perf_counter()))
+
+        if docx_jobs:
+            docx_pool = DocxPdfPool(workers=min(workers, DOCX_POOL_WORKERS), backend=docx_backend)
+            pending = []
+            cache_entries = {}
+            for job in docx_jobs:
+                record, entries = _fetch_cached(job, cache)
+                if record is not None:
+                    _record(job, record)
+                else:
+                    cache_entries[id(job)] = entries
+                    pending.append(job)
+
+            def _on_docx_record(job, record):
+                _store_cached(record, cache_entries[id(job)], cache)
+                _record(job, record)
+
+            docx_pool.submit(pending, _on_docx_record)
+
+        inline_jobs = []
+        with contextlib.ExitStack() as stack:
+            executors = {}
+            if thread_jobs:
+                executors[EXECUTOR_THREAD] = stack.enter_context(
+                    ThreadPoolExecutor(max_workers=min(workers, len(thread_jobs)))
+                )
+            if workers == 1 or len(process_jobs) <= 1:
+                inline_jobs = process_jobs
+                process_jobs = []
+            else:
+                executors[EXECUTOR_PROCESS] = stack.enter_context(
+                    ProcessPoolExecutor(max_workers=min(workers, len(process_jobs)), initializer=_init_worker)
+                )
+            peak_memory = _run_admitted(executors, thread_jobs + process_jobs, cache, workers, memory_budget, _record)
+        for job in inline_jobs:
+            _record(job, _convert_job(job, cache))
+
+        if docx_pool is not None:
+            docx_pool.join()
+
+        if cache is not None:
+            cache.evict()
+
+        duration = time.time() - start_time
+        summary = {
+            "total": total_files,
+            "success": sum(1 for record in records if record["ok"]),
+            "failed": sum(1 for record in records if not record["ok"]),
+            "cached": sum(1 for record in records if record["cached"]),
+            "resumed": len(completed),
+            "duration": round(duration, 2),
+            "files_per_sec": round(total_files / duration, 2) if duration > 0 else 0.0,
+            "log_path": log_path,
+            "memory_budget_mb": round(memory_budget / (1024 * 1024)) if memory_budget else None,
+            "peak_memory_estimate_mb": round(peak_memory / (1024 * 1024), 1),
+        }
+        summary.update(summarize_records(records))
+        if log_file:
+            log_file.write(json.dumps(dict(summary, type="summary"), default=str) + "\n")
+        clean_finish = summary["failed"] == 0
+        return summary
+    finally:
+        if docx_pool is not None:
+            docx_pool.close()
+        if manifest is not None:
+            manifest.close(remove=clean_finish)
+        if log_file:
+            log_file.close()
+
+WATCH_POLL_INTERVAL = 1.0
+WATCH_DEBOUNCE_SECONDS = 2.0
+WATCH_QUEUE_SIZE = 64
+WATCH_IGNORED_SUFFIXES = (".part", ".tmp", ".crdownload", ".partial")
+# FAT/SMB menyimpan mtime dengan resolusi hingga 2 detik: file yang dibuat pada
+# "tick" yang sama dengan scan terakhir tidak mengubah mtime direktori.
+WATCH_MTIME_GRANULARITY = 2.0
+WATCH_FULL_RESCAN_SECONDS = 30.0
+
+class FolderWatcher:
+    """Pantau folder input dan konversi setiap file baru secara terus-menerus.
+
+    Folder hanya di-scan ulang ketika mtime direktori berubah (ada file
+    ditambah/diganti), masih dalam `WATCH_MTIME_GRANULARITY` detik dari
+    sekarang, atau sudah `WATCH_FULL_RESCAN_SECONDS` detik sejak scan penuh
+    terakhir; file yang belum stabil saja yang di-stat setiap tick.
+    File dianggap selesai ditulis bila ukuran dan mtime-nya tidak berubah
+    selama `debounce` detik. File siap masuk antrean kerja berukuran tetap;
+    bila antrean penuh, scanner ikut menunggu (backpressure) sehingga pool
+    tidak kebanjiran.
+    """
+
+    def __init__(self, input_folder, output_folder, category, from_format, to_format,
+                 target_size_kb=None, max_dimension=None, workers=None, cache=None,
+                 poll_interval=WATCH_POLL_INTERVAL, debounce=WATCH_DEBOUNCE_SECONDS,
+                 queue_size=WATCH_QUEUE_SIZE, on_record=None, log_path=None, docx_backend=None, fsync=False,
+                 job_options=None):
+        if os.path.abspath(input_folder) == os.path.abspath(output_folder):
+            raise ValueError("Folder output harus berbeda dari folder yang dipantau.")
+        self.input_folder = input_folder
+        self.output_folder = output_folder
+        self.job_settings = (category, from_format, to_format, target_size_kb, max_dimension, fsync)
+        self.job_options = job_options or {}
+        self.extensions = None if from_format == AUTO_FORMAT else FORMAT_EXTENSIONS.get(from_format, ())
+        self.workers = max(1, int(workers or DEFAULT_WORKERS))
+        self.cache = cache
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.on_record = on_record
+        self.log_path = log_path
+        self.docx_backend = docx_backend
+        self.work_queue = queue.Queue(maxsize=queue_size)
+        self.stop_event = threading.Event()
+        self.known = {}
+        self.pending = {}
+        self.dir_mtime = None
+        self.last_scan = None
+        self.lock = threading.Lock()
+        self.stats = {"queued": 0, "success": 0, "failed": 0, "skipped": 0}
+
+    def stop(self):
+        self.stop_event.set()
+
+    def _is_candidate(self, name):
+        lower = name.lower()
+        return (
+            not name.startswith((".", "~$"))
+            and not lower.endswith(WATCH_IGNORED_SUFFIXES)
+            and (self.extensions is None or lower.endswith(self.extensions))
+        )
+
+    def _scan_directory(self):
+        """Scan folder bila mtime direktori berubah, belum pasti final, atau scan penuh sudah lama."""
+        try:
+            dir_mtime = os.stat(self.input_folder).st_mtime_ns
+        except OSError:
+            return
+        now = time.monotonic()
+        if (
+            dir_mtime == self.dir_mtime
+            and time.time() - dir_mtime / 1e9 > WATCH_MTIME_GRANULARITY
+            and now - self.last_scan < WATCH_FULL_RESCAN_SECONDS
+        ):
+            return
+        self.dir_mtime = dir_mtime
+        self.last_scan = now
+        with os.scandir(self.input_folder) as entries:
+            for entry in entries:
+                if not self._is_candidate(entry.name) or entry.path in self.pending:
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                if self.known.get(entry.path) != stat.st_mtime_ns:
+                    self.pending[entry.path] = (stat.st_size, stat.st_mtime_ns, time.monotonic())
+
+    def _ready_files(self):
+        """Stat file yang tertunda dan kembalikan yang sudah stabil selama `debounce` detik."""
+        now = time.monotonic()
+        ready = []
+        for path, (size, mtime, since) in list(self.pending.items()):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                del self.pending[path]
+                continue
+            if (stat.st_size, stat.st_mtime_ns) != (size, mtime):
+                self.pending[path] = (stat.st_size, stat.st_mtime_ns, now)
+            elif now - since >= self.debounce:
+                ready.append((path, mtime))
+        return ready
+
+    def _enqueue(self, path, mtime):
+        category, from_format, *settings = self.job_settings
+        if from_format == AUTO_FORMAT:
+            try:
+                job = auto_job(path, self.output_folder, category, *settings, **self.job_options)
+            except ValueError:
+                del self.pending[path]
+                self.known[path] = mtime
+                self.stats["skipped"] += 1
+                return
+        else:
+            job = make_job(path, self.output_folder, *self.job_settings, **self.job_options)
+        while not self.stop_event.is_set():
+            try:
+                self.work_queue.put(job, timeout=self.poll_interval)
+            except queue.Full:
+                continue
+            del self.pending[path]
+            self.known[path] = mtime
+            self.stats["queued"] += 1
+            return
+
+    def _finish(self, job, record, slots):
+        slots.release()
+        with self.lock:
+            self.stats["success" if record["ok"] else "failed"] += 1
+            if self.log_path:
+                with open(self.log_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(dict(record, type="file"), default=str) + "\n")
+            if self.on_record:
+                self.on_record(job, record)
+
+    def _dispatch(self, executors, docx_pool):
+        """Ambil job dari antrean dan kirim ke pool, maksimal 2x jumlah worker sekaligus."""
+        slots = threading.BoundedSemaphore(self.workers * 2)
+        while not (self.stop_event.is_set() and self.work_queue.empty()):
+            try:
+                job = self.work_queue.get(timeout=self.poll_interval)
+            except queue.Empty:
+                continue
+            slots.acquire()
+            record, entries = _fetch_cached(job, self.cache)
+            if record is not None:
+                self._finish(job, record, slots)
+            elif job_route(job).executor == EXECUTOR_DOCX:
+                def on_docx_record(job, record, entries=entries):
+                    _store_cached(record, entries, self.cache)
+                    self._finish(job, record, slots)
+                docx_pool.submit([job], on_docx_record)
+            else:
+                future = executors[job_route(job).executor].submit(_convert_job, job, self.cache)
+                future.add_done_callback(lambda future, job=job: self._finish(job, _future_record(job, future), slots))
+            self.work_queue.task_done()
+
+    def run(self):
+        """Jalankan watcher sampai `stop()` dipanggil; job yang sudah diantrekan tetap diselesaikan."""
+        os.makedirs(self.output_folder, exist_ok=True)
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker) as process_executor, \
+                ThreadPoolExecutor(max_workers=self.workers) as thread_executor, \
+                DocxPdfPool(workers=min(self.workers, DOCX_POOL_WORKERS), backend=self.docx_backend) as docx_pool:
+            executors = {EXECUTOR_PROCESS: process_executor, EXECUTOR_THREAD: thread_executor}
+            dispatcher = threading.Thread(target=self._dispatch, args=(executors, docx_pool), daemon=True)
+            dispatcher.start()
+            try:
+                while not self.stop_event.is_set():
+                    self._scan_directory()
+                    for path, mtime in self._ready_files():
+                        self._enqueue(path, mtime)
+                    self.stop_event.wait(self.poll_interval)
+            finally:
+                self.stop_event.set()
+                dispatcher.join()
+                docx_pool.join()
+        if self.cache is not None:
+            self.cache.evict()
+        return dict(self.stats)
+
+def resolve_conversion(category, from_format, to_format=None):
+    """Cocokkan nama kategori/format dengan CONVERSION_CONFIG (tidak peka huruf besar/kecil)."""
+    categories = {name.lower(): name for name in CONVERSION_CONFIG}
+    category = categories.get(str(category).lower())
+    if category is None:
+        raise ValueError(f"Kategori tidak dikenal. Pilihan: {', '.join(CONVERSION_CONFIG)}")
+
+    config = CONVERSION_CONFIG[category]
+    from_format = str(from_format).upper()
+    if from_format == AUTO_FORMAT:
+        # Format output dicocokkan per file setelah deteksi; None = pilihan pertama tiap format.
+        output_formats = list(dict.fromkeys(fmt for outputs in config["output_map"].values() for fmt in outputs))
+        if to_format is None:
+            return category, from_format, None
+    elif from_format not in config["formats"]:
+        raise ValueError(f"Format input '{from_format}' tidak didukung untuk kategori {category}.")
+    else:
+        output_formats = config["output_map"][from_format]
+
+    if to_format is None:
+        to_format = output_formats[0]
+    else:
+        matches = [fmt for fmt in output_formats if fmt.upper() == str(to_format).upper() or fmt.split()[0] == str(to_format).upper()]
+        if not matches:
+            raise ValueError(f"Format output '{to_format}' tidak didukung. Pilihan: {', '.join(output_formats)}")
+        to_format = matches[0]
+    return category, from_format, to_format
+
+def make_job(input_path, output_folder, category, from_format, to_format, target_size_kb=None,
+             max_dimension=None, fsync=False, **options):
+    """Susun dict job untuk `convert_file`; `to_format` list menghasilkan job multi-output.
+
+    `options` (mis. `sheets`, `dtypes`, `xlsx_engine`) ikut disimpan di job.
+    Untuk XLSX dengan `sheets`, setiap sheet mendapat path output sendiri;
+    `ALL_SHEETS` dijabarkan dari daftar sheet di workbook.
+    """
+    options = {name: value for name, value in options.items() if value is not None}
+    if isinstance(to_format, (list, tuple)):
+        output_path = [build_output_path(input_path, output_folder, category, fmt) for fmt in to_format]
+        to_format = list(to_format)
+    else:
+        output_path = build_output_path(input_path, output_folder, category, to_format)
+        if from_format == "XLSX" and options.get("sheets") is not None:
+            try:
+                sheets = xlsx_sheet_names(input_path) if options["sheets"] == ALL_SHEETS else list(options["sheets"])
+            except (OSError, KeyError, zipfile.BadZipFile, ElementTree.ParseError):
+                # Biarkan konversi yang melaporkan file rusak sebagai kegagalan.
+                sheets = None
+            if sheets is not None:
+                options["sheets"] = sheets
+                output_path = [sheet_output_path(output_path, sheet) for sheet in sheets]
+    return {
+        "input_path": input_path,
+        "output_path": output_path,
+        "from_format": from_format,
+        "to_format": to_format,
+        "category": category,
+        "target_size_kb": target_size_kb,
+        "max_dimension": max_dimension,
+        "fsync": fsync,
+        **options,
+    }
+
+def auto_job(input_path, output_folder, category, to_format=None, target_size_kb=None, max_dimension=None,
+             fsync=False, **options):
+    """Susun job untuk satu file dengan format input hasil `sniff_format`; ValueError bila tidak bisa dirutekan.
+
+    `to_format` list hanya menyisakan format yang tersedia untuk format terdeteksi.
+    """
+    from_format = sniff_format(input_path)
+    if from_format is None:
+        raise ValueError("Format file tidak dikenali.")
+    output_formats = CONVERSION_CONFIG[category]["output_map"].get(from_format)
+    if not output_formats:
+        raise ValueError(f"Format {from_format} tidak didukung untuk kategori {category}.")
+    if to_format is None:
+        to_format = output_formats[0]
+    elif isinstance(to_format, (list, tuple)):
+        to_format = [fmt for fmt in to_format if fmt in output_formats]
+        if not to_format:
+            raise ValueError(f"{from_format} tidak bisa dikonversi ke format yang dipilih.")
+        if len(to_format) == 1:
+            to_format = to_format[0]
+    elif to_format not in output_formats:
+        raise ValueError(f"{from_format} tidak bisa dikonversi ke {to_format}.")
+    return make_job(
+        input_path, output_folder, category, from_format, to_format, target_size_kb, max_dimension, fsync, **options
+    )
+
+def plan_auto_jobs(input_paths, output_folder, category, to_format=None, target_size_kb=None, max_dimension=None,
+                   fsync=False, **options):
+    """Deteksi format setiap file dan susun satu batch campuran.
+
+    Mengembalikan `(jobs, skipped)`; `skipped` berisi dict `input_path`/`reason`
+    untuk file yang formatnya tidak dikenali atau tidak punya rute ke `to_format`.
+    """
+    jobs = []
+    skipped = []
+    for input_path in input_paths:
+        try:
+            jobs.append(auto_job(
+                input_path, output_folder, category, to_format, target_size_kb, max_dimension, fsync, **options
+            ))
+        except ValueError as e:
+            skipped.append({"input_path": input_path, "reason": str(e)})
+    return jobs, skipped
+
+def convert_batch(input_paths, output_folder, category, from_format, to_format=None,
+                  target_size_kb=None, workers=None, on_progress=None, cache=None,
+                  max_dimension=None, log_path=None, docx_backend=None, fsync=False, resume=False,
+                  memory_budget_mb=None, **options):
+    """Konversi sekumpulan file tanpa GUI dan kembalikan ringkasan dari `run_batch`.
+
+    `to_format` boleh berupa list (atau string dipisah koma) untuk kategori Gambar
+    agar setiap file hanya didecode sekali untuk semua format tujuan. `fsync`
+    memaksa setiap output ke disk sebelum di-rename ke nama akhirnya. Progres
+    dicatat di `JobManifest` folder output; `resume=True` melewati file yang
+    sudah selesai pada run sebelumnya yang terputus. Dengan `from_format="AUTO"`
+    format setiap file dideteksi dari isinya (lihat `plan_auto_jobs`); file yang
+    tidak bisa dirutekan dilaporkan di `summary["skipped"]`. `options` adalah
+    opsi khusus rute yang diteruskan ke `make_job`.
+    """
+    category, from_format, to_format, target_size_kb, max_dimension = prepare_settings(
+        category, from_format, to_format, target_size_kb, max_dimension
+    )
+    os.makedirs(output_folder, exist_ok=True)
+    if from_format == AUTO_FORMAT:
+        jobs, skipped = plan_auto_jobs(
+            input_paths, output_folder, category, to_format, target_size_kb, max_dimension, fsync, **options
+        )
+    else:
+        jobs = [
+            make_job(
+                input_path, output_folder, category, from_format, to_format, target_size_kb, max_dimension, fsync,
+                **options
+            )
+            for input_path in input_paths
+        ]
+        skipped = []
+    summary = run_batch(
+        jobs, workers=workers, on_progress=on_progress, cache=cache, log_path=log_path, docx_backend=docx_backend,
+        manifest=JobManifest(output_folder, resume=resume), memory_budget_mb=memory_budget_mb
+    )
+    summary["skipped"] = skipped
+    return summary
+
+def prepare_settings(category, from_format, to_format=None, target_size_kb=None, max_dimension=None):
+    """Validasi dan normalisasi pengaturan konversi; ValueError bila tidak valid."""
+    if isinstance(to_format, str) and "," in to_format:
+        to_format = [fmt.strip() for fmt in to_format.split(",") if fmt.strip()]
+    if isinstance(to_format, (list, tuple)):
+        resolved = [resolve_conversion(category, from_format, fmt) for fmt in to_format]
+        category, from_format = resolved[0][0], resolved[0][1]
+        to_format = list(dict.fromkeys(fmt for _, _, fmt in resolved))
+        if category != "Gambar" and len(to_format) > 1:
+            raise ValueError("Multi-output hanya didukung untuk kategori Gambar.")
+        if len(to_format) == 1:
+            to_format = to_format[0]
+    else:
+        category, from_format, to_format = resolve_conversion(category, from_format, to_format)
+    if category == "Kompresi":
+        if target_size_kb is None or int(target_size_kb) <= 0:
+            raise ValueError("Target ukuran harus angka positif.")
+        target_size_kb = int(target_size_kb)
+    if max_dimension is not None:
+        if category not in ("Gambar", "Kompresi") or int(max_dimension) <= 0:
+            raise ValueError("Dimensi maksimum harus angka positif dan hanya berlaku untuk gambar.")
+        max_dimension = int(max_dimension)
+    return category, from_format, to_format, target_size_kb, max_dimension
+
+def watch_folder(input_folder, output_folder, category, from_format, to_format=None, target_size_kb=None,
+                 max_dimension=None, **options):
+    """Pantau `input_folder` terus-menerus (lihat `FolderWatcher`) sampai dihentikan."""
+    settings = prepare_settings(category, from_format, to_format, target_size_kb, max_dimension)
+    category, from_format, to_format, target_size_kb, max_dimension = settings
+    watcher = FolderWatcher(
+        input_folder, output_folder, category, from_format, to_format,
+        target_size_kb=target_size_kb, max_dimension=max_dimension, **options
+    )
+    try:
+        return watcher.run()
+    except KeyboardInterrupt:
+        watcher.stop()
+        return dict(watcher.stats)
+
+def convert_docx_directory(input_folder, output_folder, workers=DOCX_POOL_WORKERS, backend=None, **options):
+    """Konversi semua file .docx di satu folder ke PDF memakai pool DOCX yang sama."""
+    input_paths = [
+        path for path in expand_inputs([input_folder], FORMAT_EXTENSIONS["DOCX"])
+        if not os.path.basename(path).startswith("~$")
+    ]
+    return convert_batch(
+        input_paths, output_folder, "Dokumen", "DOCX", "PDF", workers=workers, docx_backend=backend, **options
+    )
+
+SERVICE_HOST = "127.0.0.1"
+SERVICE_PORT = 8765
+SERVICE_QUEUE_SIZE = 64
+SERVICE_TIMEOUT = 300.0
+SERVICE_MAX_UPLOAD_MB = 256
+SERVICE_CHUNK_SIZE = 1024 * 1024
+SERVICE_SOCKET_TIMEOUT = 60
+SERVICE_LATENCY_SAMPLES = 1000
+SERVICE_THROUGHPUT_WINDOW = 60.0
+# Parameter request -> nama argumen `prepare_settings`/`make_job`.
+SERVICE_PARAMS = {
+    "category": "category",
+    "from": "from_format",
+    "to": "to_format",
+    "target_kb": "target_size_kb",
+    "max_dim": "max_dimension",
+    "optimize": "optimize",
+    "optimize_budget": "optimize_budget",
+    "sheets": "sheets",
+    "dtypes": "dtypes",
+    "xlsx_engine": "xlsx_engine",
+    "strip_metadata": "strip_metadata",
+}
+
+def _percentile(sorted_values, fraction):
+    """Persentil nearest-rank dari list yang sudah terurut; None bila kosong."""
+    if not sorted_values:
+        return None
+    return sorted_values[max(0, math.ceil(fraction * len(sorted_values)) - 1)]
+
+def _is_within(path, roots):
+    path = os.path.realpath(path)
+    return any(os.path.commonpath([path, root]) == root for root in roots)
+
+class ServiceMetrics:
+    """Penghitung layanan HTTP untuk `/metrics`; aman dipakai dari banyak thread.
+
+    Latensi (antre + konversi) disimpan untuk `SERVICE_LATENCY_SAMPLES` job
+    terakhir, throughput dihitung dari job yang selesai dalam jendela
+    `SERVICE_THROUGHPUT_WINDOW` detik terakhir.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = time.monotonic()
+        self.in_flight = 0
+        self.counters = {
+            "admitted": 0, "success": 0, "failed": 0, "cached": 0, "rejected": 0, "timed_out": 0,
+            "bytes_in": 0, "bytes_out": 0,
+        }
+        self.latencies = collections.deque(maxlen=SERVICE_LATENCY_SAMPLES)
+        self.finished_at = collections.deque()
+
+    def count(self, name, amount=1):
+        with self.lock:
+            self.counters[name] += amount
+
+    def admit(self):
+        with self.lock:
+            self.in_flight += 1
+            self.counters["admitted"] += 1
+
+    def finish(self, record, seconds):
+        now = time.monotonic()
+        with self.lock:
+            self.in_flight -= 1
+            self.counters["success" if record["ok"] else "failed"] += 1
+            self.counters["cached"] += int(record["cached"])
+            self.counters["bytes_in"] += record["bytes_in"]
+            self.counters["bytes_out"] += record["bytes_out"]
+            self.latencies.append(seconds)
+            self.finished_at.append(now)
+            self._trim(now)
+
+    def _trim(self, now):
+        while self.finished_at and now - self.finished_at[0] > SERVICE_THROUGHPUT_WINDOW:
+            self.finished_at.popleft()
+
+    def snapshot(self, workers, queue_size):
+        now = time.monotonic()
+        with self.lock:
+            self._trim(now)
+            latencies = sorted(self.latencies)
+            window = min(SERVICE_THROUGHPUT_WINDOW, max(now - self.started, 1e-9))
+            return {
+                "uptime_s": round(now - self.started, 1),
+                "workers": workers,
+                "queue_size": queue_size,
+                "in_flight": self.in_flight,
+                # Job di atas jumlah worker sedang menunggu giliran di pool.
+                "queue_depth": max(0, self.in_flight - workers),
+                **self.counters,
+                "latency_ms": {
+                    name: None if value is None else round(value * 1000, 1)
+                    for name, value in (
+                        ("p50", _percentile(latencies, 0.50)),
+                        ("p90", _percentile(latencies, 0.90)),
+                        ("p99", _percentile(latencies, 0.99)),
+                        ("max", latencies[-1] if latencies else None),
+                    )
+                },
+                "throughput_files_per_sec": round(len(self.finished_at) / window, 2),
+            }
+
+class ConversionService:
+    """Jalankan job dari banyak request HTTP sekaligus di atas pool worker bersama.
+
+    Job dikirim ke executor sesuai rutenya (process, thread atau pool DOCX),
+    sama seperti `run_batch`. Paling banyak `queue_size` job boleh berjalan
+    atau menunggu sekaligus; di atas itu `submit` menolak job (backpressure)
+    alih-alih menumpuk antrean tanpa batas. Mode path hanya boleh membaca dan
+    menulis di dalam `allowed_roots`; tanpa itu hanya mode upload yang aktif.
+    """
+
+    def __init__(self, workers=None, cache=None, queue_size=SERVICE_QUEUE_SIZE, timeout=SERVICE_TIMEOUT,
+                 max_upload_bytes=SERVICE_MAX_UPLOAD_MB * 1024 * 1024, allowed_roots=None, docx_backend=None,
+                 fsync=False):
+        self.workers = max(1, int(workers or DEFAULT_WORKERS))
+        self.cache = cache
+        self.queue_size = max(1, int(queue_size))
+        self.timeout = timeout
+        self.max_upload_bytes = max_upload_bytes
+        self.allowed_roots = [os.path.realpath(root) for root in allowed_roots or []]
+        self.docx_backend = docx_backend
+        self.fsync = fsync
+        self.slots = threading.BoundedSemaphore(self.queue_size)
+        self.metrics = ServiceMetrics()
+        self.lock = threading.Lock()
+        self.executors = {}
+        self.docx_pool = None
+
+    def __enter__(self):
+        self.executors = {
+            EXECUTOR_PROCESS: ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker),
+            EXECUTOR_THREAD: ThreadPoolExecutor(max_workers=self.workers),
+        }
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        for executor in self.executors.values():
+            executor.shutdown(wait=True, cancel_futures=True)
+        if self.docx_pool is not None:
+            self.docx_pool.close()
+        if self.cache is not None:
+            self.cache.evict()
+
+    def build_job(self, params, input_path, output_folder):
+        """Susun job dari parameter request (lihat `SERVICE_PARAMS`); ValueError bila tidak valid."""
+        unknown = set(params) - set(SERVICE_PARAMS)
+        if unknown:
+            raise ValueError(f"Parameter tidak dikenal: {', '.join(sorted(unknown))}")
+        settings = {SERVICE_PARAMS[name]: value for name, value in params.items() if value not in (None, "")}
+        if "category" not in settings:
+            raise ValueError("Parameter 'category' wajib diisi.")
+        category, from_format, to_format, target_size_kb, max_dimension = prepare_settings(
+            settings.pop("category"), settings.pop("from_format", AUTO_FORMAT), settings.pop("to_format", None),
+            settings.pop("target_size_kb", None), settings.pop("max_dimension", None)
+        )
+        options = self._job_options(settings)
+        if from_format == AUTO_FORMAT:
+            return auto_job(
+                input_path, output_folder, category, to_format, target_size_kb, max_dimension, self.fsync, **options
+            )
+        return make_job(
+            input_path, output_folder, category, from_format, to_format, target_size_kb, max_dimension, self.fsync,
+            **options
+        )
+
+    def _job_options(self, settings):
+        """Normalisasi opsi khusus rute dari request, setara `cli_job_options`."""
+        options = {}
+        if "optimize" in settings:
+            options["optimize"] = int(settings["optimize"])
+            if options["optimize"] not in OPTIMIZE_LEVEL_NAMES:
+                raise ValueError(f"Level optimasi harus salah satu dari {', '.join(map(str, OPTIMIZE_LEVEL_NAMES))}.")
+        if "optimize_budget" in settings:
+            options["optimize_budget"] = float(settings["optimize_budget"])
+        sheets = settings.get("sheets")
+        if isinstance(sheets, str) and sheets != ALL_SHEETS:
+            sheets = [name.strip() for name in sheets.split(",") if name.strip()]
+        options["sheets"] = sheets or None
+        dtypes = settings.get("dtypes")
+        if isinstance(dtypes, str) and os.path.exists(dtypes):
+            # Skema dari file hanya untuk CLI; request tidak boleh membuka file di server.
+            raise ValueError("Skema dtype harus ditulis langsung, mis. 'kolom:int,kolom2:str'.")
+        options["dtypes"] = load_dtype_schema(dtypes)
+        if settings.get("xlsx_engine") not in (None, *XLSX_ENGINES):
+            raise ValueError(f"Engine XLSX harus salah satu dari {', '.join(XLSX_ENGINES)}.")
+        options["xlsx_engine"] = settings.get("xlsx_engine")
+        if str(settings.get("strip_metadata", "")).lower() in ("1", "true", "ya"):
+            options["strip_metadata"] = True
+        return options
+
+    def check_path(self, path):
+        """ValueError bila `path` berada di luar `allowed_roots` (atau mode path tidak aktif)."""
+        if not self.allowed_roots:
+            raise ValueError("Mode path tidak aktif; jalankan layanan dengan --allow-path.")
+        if not _is_within(path, self.allowed_roots):
+            raise ValueError(f"Path di luar folder yang diizinkan: {path}")
+
+    def submit(self, job):
+        """Kirim job ke pool; mengembalikan Future berisi catatan, atau None bila antrean penuh."""
+        if not self.slots.acquire(blocking=False):
+            self.metrics.count("rejected")
+            return None
+        self.metrics.admit()
+        start = time.perf_counter()
+        executor_name = job_route(job).executor
+        if executor_name == EXECUTOR_DOCX:
+            future = Future()
+            record, entries = _fetch_cached(job, self.cache)
+            if record is not None:
+                future.set_result(record)
+            else:
+                def on_docx_record(job, record):
+                    _store_cached(record, entries, self.cache)
+                    future.set_result(record)
+                with self.lock:
+                    if self.docx_pool is None:
+                        self.docx_pool = DocxPdfPool(workers=min(self.workers, DOCX_POOL_WORKERS), backend=self.docx_backend)
+                    self.docx_pool.submit([job], on_docx_record)
+        else:
+            future = self.executors[executor_name].submit(_convert_job, job, self.cache)
+        future.add_done_callback(lambda future: self._finish(job, future, start))
+        return future
+
+    def _finish(self, job, future, start):
+        self.slots.release()
+        self.metrics.finish(_future_record(job, future), time.perf_counter() - start)
+
+    def metrics_snapshot(self):
+        return self.metrics.snapshot(self.workers, self.queue_size)
+
+class _ServiceHandler:
+    """Route HTTP layanan konversi; lihat `ConversionService` untuk antrean dan batasnya.
+
+    `POST /convert?category=...&from=...&to=...` dengan isi file sebagai body
+    mengembalikan file hasil (ZIP bila outputnya lebih dari satu). Body JSON
+    berisi `input_path`/`output_folder` mengonversi file di disk server dan
+    mengembalikan catatan konversi. `GET /metrics` dan `GET /formats` memberi
+    statistik layanan dan rute yang tersedia.
+
+    Ditulis sebagai mixin: `create_server` menggabungkannya dengan
+    `http.server.BaseHTTPRequestHandler` agar http.server, mimetypes dan
+    urllib tidak diimpor saat CLI/GUI biasa dijalankan.
+    """
+
+    protocol_version = "HTTP/1.1"
+    server_version = "converter_file"
+    timeout = SERVICE_SOCKET_TIMEOUT
+
+    @property
+    def service(self):
+        return self.server.service
+
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status, message, headers=None):
+        # Body request yang belum dibaca membuat koneksi keep-alive tidak bisa dipakai lagi.
+        self.close_connection = True
+        self._send_json(status, {"error": message}, dict(headers or {}, Connection="close"))
+
+    def _send_file(self, path, filename, record):
+        import mimetypes
+        import urllib.parse
+
+        self.send_response(200)
+        self.send_header("Content-Type", mimetypes.guess_type(filename)[0] or "application/octet-stream")
+        self.send_header("Content-Length", str(os.path.getsize(path)))
+        self.send_header("Content-Disposition", f"attachment; filename*=UTF-8''{urllib.parse.quote(filename)}")
+        self.send_header("X-Conversion-Seconds", str(record["seconds"]))
+        self.send_header("X-Conversion-Cached", str(record["cached"]).lower())
+        self.end_headers()
+        with open(path, "rb") as f:
+            shutil.copyfileobj(f, self.wfile, SERVICE_CHUNK_SIZE)
+
+    def _upload_too_large(self):
+        length = self.headers.get("Content-Length", "")
+        return length.isdigit() and int(length) > self.service.max_upload_bytes
+
+    def handle_expect_100(self):
+        # Klien yang mengirim "Expect: 100-continue" langsung menerima 413
+        # tanpa sempat mengunggah file yang terlalu besar.
+        if self._upload_too_large():
+            self._send_error(413, f"Upload melebihi batas {self.service.max_upload_bytes // (1024 * 1024)} MB.")
+            return False
+        return super().handle_expect_100()
+
+    def do_GET(self):
+        import urllib.parse
+
+        path = urllib.parse.urlsplit(self.path).path
+        if path == "/metrics":
+            self._send_json(200, self.service.metrics_snapshot())
+        elif path == "/formats":
+            self._send_json(200, {category: config["output_map"] for category, config in CONVERSION_CONFIG.items()})
+        else:
+            self._send_error(404, "Route tidak ditemukan.")
+
+    def do_POST(self):
+        import urllib.parse
+
+        url = urllib.parse.urlsplit(self.path)
+        if url.path != "/convert":
+            self._send_error(404, "Route tidak ditemukan.")
+            return
+        length = self.headers.get("Content-Length")
+        if length is None or not length.isdigit():
+            self._send_error(411, "Header Content-Length wajib diisi.")
+            return
+        if self._upload_too_large():
+            self._send_error(413, f"Upload melebihi batas {self.service.max_upload_bytes // (1024 * 1024)} MB.")
+            return
+        length = int(length)
+        params = {name: values[-1] for name, values in urllib.parse.parse_qs(url.query).items()}
+        try:
+            if self.headers.get_content_type() == "application/json":
+                self._convert_path(length)
+            else:
+                self._convert_upload(params, length)
+        except (ValueError, KeyError) as e:
+            self._send_error(400, str(e))
+        except ConnectionError:
+            # Klien memutus koneksi di tengah upload; tidak ada yang bisa dibalas.
+            self.close_connection = True
+
+    def _run(self, job):
+        """Tunggu hasil job; mengembalikan `(record_atau_None, future)`.
+
+        Bila job ditolak, melewati batas waktu atau gagal, respons error sudah
+        dikirim dan record bernilai None. Job yang timeout tetap berjalan di
+        pool sampai selesai (future belum `done()`).
+        """
+        future = self.service.submit(job)
+        if future is None:
+            self._send_error(503, "Antrean konversi penuh, coba lagi nanti.", {"Retry-After": "1"})
+            return None, None
+        try:
+            record = future.result(timeout=self.service.timeout)
+        except FutureTimeoutError:
+            self.service.metrics.count("timed_out")
+            self._send_error(504, f"Konversi melebihi batas waktu {self.service.timeout:g} detik.")
+            return None, future
+        if not record["ok"]:
+            self._send_json(422, {"error": record["error"], "error_type": record["error_type"], "record": record})
+            return None, future
+        return record, future
+
+    def _convert_path(self, length):
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Body JSON tidak valid: {e}") from None
+        if not isinstance(request, dict):
+            raise ValueError("Body JSON harus berupa objek.")
+        input_path = request.pop("input_path", None)
+        output_folder = request.pop("output_folder", None)
+        if not input_path or not output_folder:
+            raise ValueError("'input_path' dan 'output_folder' wajib diisi.")
+        self.service.check_path(input_path)
+        self.service.check_path(output_folder)
+        if not os.path.isfile(input_path):
+            raise ValueError(f"File input tidak ditemukan: {input_path}")
+        job = self.service.build_job(request, input_path, output_folder)
+        record, _ = self._run(job)
+        if record is not None:
+            self._send_json(200, record)
+
+    def _receive_upload(self, path, length):
+        """Tulis body request ke disk per potongan tanpa menampung seluruh file di memori."""
+        remaining = length
+        with open(path, "wb") as f:
+            while remaining:
+                chunk = self.rfile.read(min(SERVICE_CHUNK_SIZE, remaining))
+                if not chunk:
+                    raise ConnectionError("Upload terputus sebelum selesai.")
+                f.write(chunk)
+                remaining -= len(chunk)
+
+    def _convert_upload(self, params, length):
+        filename = params.pop("filename", None) or self.headers.get("X-Filename") or ""
+        filename = INVALID_FILENAME_CHARS.sub("_", os.path.basename(filename)).strip(". ")
+        if not filename:
+            extensions = FORMAT_EXTENSIONS.get(str(params.get("from", "")).upper(), ("",))
+            filename = "upload" + extensions[0]
+        work_folder = tempfile.mkdtemp(prefix="converter_service_")
+        future = None
+        try:
+            input_path = os.path.join(work_folder, filename)
+            self._receive_upload(input_path, length)
+            job = self.service.build_job(params, input_path, os.path.join(work_folder, "hasil"))
+            record, future = self._run(job)
+            if record is None:
+                return
+            outputs = job_outputs(job["to_format"], job["output_path"])
+            if len(outputs) == 1:
+                self._send_file(outputs[0][1], os.path.basename(outputs[0][1]), record)
+                return
+            archive_path = os.path.join(work_folder, os.path.splitext(filename)[0] + ".zip")
+            # Gambar dan dokumen Office sudah terkompresi; ZIP hanya membungkus.
+            with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_STORED) as archive:
+                for _, output_path in outputs:
+                    archive.write(output_path, os.path.basename(output_path))
+            self._send_file(archive_path, os.path.basename(archive_path), record)
+        finally:
+            if future is not None and not future.done():
+                # Worker masih menulis ke folder ini; hapus setelah job yang timeout selesai.
+                future.add_done_callback(lambda _: shutil.rmtree(work_folder, ignore_errors=True))
+            else:
+                shutil.rmtree(work_folder, ignore_errors=True)
+
+def create_server(service, host=SERVICE_HOST, port=SERVICE_PORT):
+    """Buat `ThreadingHTTPServer` untuk `service`; port 0 memilih port kosong."""
+    import http.server
+
+    handler = type("ServiceHandler", (_ServiceHandler, http.server.BaseHTTPRequestHandler), {})
+    server = http.server.ThreadingHTTPServer((host, port), handler)
+    server.service = service
+    return server
+
+def serve(host=SERVICE_HOST, port=SERVICE_PORT, on_ready=None, **options):
+    """Jalankan layanan HTTP sampai Ctrl+C; `options` diteruskan ke `ConversionService`."""
+    with ConversionService(**options) as service:
+        server = create_server(service, host, port)
+        if on_ready:
+            on_ready(server)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+
+def default_log_path(output_folder):
+    return os.path.join(output_folder, time.strftime("konversi_log_%Y%m%d-%H%M%S.jsonl"))
+
+def format_run_report(summary, max_failures=3):
+    """Susun teks ringkas waktu per tahap, kegagalan dan lokasi log untuk ditampilkan.
+
+    `max_failures=0` tidak mencantumkan kegagalan sama sekali (CLI sudah
+    mencetaknya per file).
+    """
+    lines = []
+    if summary.get("stage_totals"):
+        stages = " • ".join(f"{name} {seconds:.2f}d" for name, seconds in summary["stage_totals"].items())
+        lines.append(f"🧩 Tahap: {stages}")
+    lines.append(f"📦 {summary.get('bytes_in', 0) / 1024:.0f} KB → {summary.get('bytes_out', 0) / 1024:.0f} KB")
+    if summary.get("bytes_saved"):
+        lines.append(f"💾 Optimasi menghemat {summary['bytes_saved'] / 1024:.0f} KB")
+    if summary.get("copied"):
+        lines.append(f"⏩ {summary['copied']} file sudah di bawah target, disalin tanpa encode ulang")
+    failures = summary.get("failures", [])
+    for failure in failures[:max_failures]:
+        lines.append(f"❌ {os.path.basename(failure['input_path'])}: {failure['error_type']}: {failure['error']}")
+    if max_failures and len(failures) > max_failures:
+        lines.append(f"… dan {len(failures) - max_failures} kegagalan lainnya")
+    if summary.get("log_path"):
+        lines.append(f"📝 Log: {summary['log_path']}")
+    return "\n".join(lines)
+
+def expand_inputs(patterns, extensions=None):
+    """Ekspansi pola glob (termasuk `**`) menjadi daftar file unik sesuai urutan.
+
+    Folder diekspansi menjadi file langsung di dalamnya, difilter dengan
+    `extensions` bila diberikan.
+    """
+    paths = []
+    seen = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = sorted(
+                path for path in glob.glob(os.path.join(glob.escape(pattern), "*"))
+                if not extensions or path.lower().endswith(extensions)
+            )
+        else:
+            matches = sorted(glob.glob(pattern, recursive=True)) or [pattern]
+        for path in matches:
+            if os.path.isfile(path) and path not in seen:
+                seen.add(path)
+                paths.append(path)
+    return paths
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(
+        prog="converter_file",
+        description="Konversi dan kompresi file tanpa GUI. Jalankan tanpa argumen untuk membuka aplikasi desktop."
+    )
+    parser.add_argument("inputs", nargs="+", help="File atau pola glob input, mis. 'foto/*.heic'")
+    parser.add_argument("-c", "--category", required=True, help=f"Kategori: {', '.join(CONVERSION_CONFIG)}")
+    parser.add_argument("-f", "--from-format", required=True, help="Format input, mis. HEIC, JPG, CSV, atau 'auto' untuk deteksi dari isi file")
+    parser.add_argument("-t", "--to-format", help="Format output, mis. PNG atau PNG,WEBP,ICO untuk multi-output (default: pilihan pertama)")
+    parser.add_argument("-o", "--output-dir", default=".", help="Folder output (default: folder saat ini)")
+    parser.add_argument("--target-kb", type=int, help="Target ukuran dalam KB untuk kategori Kompresi")
+    parser.add_argument("--max-dim", type=int, help="Perkecil gambar agar sisi terpanjang maksimal N piksel")
+    parser.add_argument("-j", "--jobs", type=int, default=DEFAULT_WORKERS, help="Jumlah worker paralel")
+    parser.add_argument("--memory-mb", type=int, help="Batas total perkiraan memori job yang berjalan bersamaan (default: separuh RAM, 0 = tanpa batas)")
+    parser.add_argument("--docx-backend", choices=DOCX_BACKENDS, help="Backend DOCX→PDF (default: otomatis)")
+    parser.add_argument("--watch", action="store_true", help="Pantau folder input (argumen pertama) dan konversi file baru terus-menerus")
+    parser.add_argument("--debounce", type=float, default=WATCH_DEBOUNCE_SECONDS, help="Detik file harus stabil sebelum diproses (mode --watch)")
+    parser.add_argument("--queue-size", type=int, default=WATCH_QUEUE_SIZE, help="Kapasitas antrean kerja (mode --watch)")
+    parser.add_argument("--optimize", type=int, choices=sorted(OPTIMIZE_LEVEL_NAMES), default=0, help="Optimasi output PNG/WEBP: 0 mati, 1 cepat, 2 seimbang, 3 maksimal")
+    parser.add_argument("--optimize-budget", type=float, default=OPTIMIZE_TIME_BUDGET, help="Setelah N detik tidak ada trial encode baru yang dimulai (per output, saat --optimize)")
+    parser.add_argument("--strip-metadata", action="store_true", help="Jangan bawa EXIF/ICC ke output gambar (orientasi tetap diterapkan)")
+    parser.add_argument("--sheets", help=f"XLSX→CSV: ekspor sheet tertentu (dipisah koma) atau '{ALL_SHEETS}' untuk semua sheet")
+    parser.add_argument("--dtypes", help="Skema tipe kolom: file JSON atau 'kolom:int,kolom2:str' (tipe: str, int, float, bool)")
+    parser.add_argument("--xlsx-engine", choices=XLSX_ENGINES, help="Pembaca XLSX (default: auto, calamine bila terpasang)")
+    parser.add_argument("--fsync", action="store_true", help="Paksa setiap output ke disk (fsync) sebelum rename; lebih lambat tapi tahan mati listrik")
+    parser.add_argument("--resume", action="store_true", help="Lanjutkan batch yang terputus: lewati file yang sudah selesai menurut manifest di folder output")
+    parser.add_argument("--log", help="Tulis catatan per file (JSON-lines) ke path ini")
+    add_cache_arguments(parser)
+    return parser
+
+def build_serve_arg_parser():
+    parser = argparse.ArgumentParser(
+        prog="converter_file serve",
+        description="Layanan HTTP lokal untuk konversi: POST /convert, GET /metrics, GET /formats."
+    )
+    parser.add_argument("--host", default=SERVICE_HOST, help=f"Alamat yang didengarkan (default: {SERVICE_HOST})")
+    parser.add_argument("--port", type=int, default=SERVICE_PORT, help=f"Port (default: {SERVICE_PORT}, 0 = port kosong)")
+    parser.add_argument("-j", "--jobs", type=int, default=DEFAULT_WORKERS, help="Jumlah worker paralel")
+    parser.add_argument("--queue-size", type=int, default=SERVICE_QUEUE_SIZE, help="Maksimal job berjalan/menunggu; di atasnya request ditolak dengan 503")
+    parser.add_argument("--timeout", type=float, default=SERVICE_TIMEOUT, help="Batas waktu (detik) satu konversi sebelum dibalas 504")
+    parser.add_argument("--max-upload-mb", type=int, default=SERVICE_MAX_UPLOAD_MB, help="Batas ukuran upload per request (413 bila lebih)")
+    parser.add_argument("--allow-path", action="append", default=[], help="Aktifkan mode path untuk folder ini (boleh diulang)")
+    parser.add_argument("--docx-backend", choices=DOCX_BACKENDS, help="Backend DOCX→PDF (default: otomatis)")
+    parser.add_argument("--fsync", action="store_true", help="Paksa setiap output ke disk (fsync) sebelum rename")
+    add_cache_arguments(parser)
+    return parser
+
+def add_cache_arguments(parser):
+    parser.add_argument("--cache", action="store_true", help="Lewati file yang hasilnya sudah ada di cache")
+    parser.add_argument("--cache-dir", help=f"Folder cache (default: {DEFAULT_CACHE_DIR}); otomatis mengaktifkan --cache")
+    parser.add_argument("--cache-max-mb", type=int, default=DEFAULT_CACHE_MAX_MB, help="Batas ukuran cache dalam MB")
+    parser.add_argument("--cache-hardlink", action="store_true", help="Gunakan hardlink, bukan salinan, untuk hit cache")
+
+def cli_cache(args):
+    """`ConversionCache` sesuai argumen CLI, atau None bila cache tidak diaktifkan."""
+    if not (args.cache or args.cache_dir):
+        return None
+    return ConversionCache(
+        args.cache_dir or DEFAULT_CACHE_DIR,
+        max_bytes=args.cache_max_mb * 1024 * 1024,
+        use_hardlinks=args.cache_hardlink
+    )
+
+def cli_job_options(args):
+    """Opsi khusus rute dari argumen CLI; ValueError bila skema dtype tidak valid."""
+    sheets = args.sheets
+    if sheets and sheets != ALL_SHEETS:
+        sheets = [name.strip() for name in sheets.split(",") if name.strip()]
+    return {
+        "sheets": sheets or None,
+        "dtypes": load_dtype_schema(args.dtypes),
+        "xlsx_engine": args.xlsx_engine,
+        "optimize": args.optimize or None,
+        "optimize_budget": args.optimize_budget if args.optimize else None,
+        "strip_metadata": args.strip_metadata or None,
+    }
+
+def run_cli(argv):
+    args = build_arg_parser().parse_args(argv)
+    try:
+        job_options = cli_job_options(args)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+    cache = cli_cache(args)
+
+    if args.watch:
+        return run_watch_cli(args, cache, job_options)
+
+    input_paths = expand_inputs(args.inputs, FORMAT_EXTENSIONS.get(args.from_format.upper()))
+    if not input_paths:
+        print("❌ Tidak ada file input yang ditemukan.", file=sys.stderr)
+        return 2
+
+    def on_progress(done, total, job, record):
+        if record["ok"]:
+            saved = record["details"].get("bytes_saved")
+            note = f", hemat {saved / 1024:.1f} KB" if saved else ""
+            print(f"[{done}/{total}] OK {job['input_path']} ({record['seconds']:.2f} detik{note})", flush=True)
+        else:
+            print(f"[{done}/{total}] GAGAL {job['input_path']}: {record['error_type']}: {record['error']}", flush=True)
+
+    try:
+        summary = convert_batch(
+            input_paths, args.output_dir, args.category, args.from_format, args.to_format,
+            target_size_kb=args.target_kb, workers=args.jobs, on_progress=on_progress, cache=cache,
+            max_dimension=args.max_dim, log_path=args.log, docx_backend=args.docx_backend, fsync=args.fsync,
+            resume=args.resume, memory_budget_mb=args.memory_mb, **job_options
+        )
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+
+    print(
+        f"Selesai: {summary['success']} berhasil ({summary['cached']} dari cache, {summary['resumed']} dilanjutkan), "
+        f"{summary['failed']} gagal, {len(summary['skipped'])} dilewati, "
+        f"{summary['duration']} detik ({summary['files_per_sec']} file/detik)"
+    )
+    for item in summary["skipped"]:
+        print(f"DILEWATI {item['input_path']}: {item['reason']}")
+    print(format_run_report(summary, max_failures=0))
+    return 0 if summary["failed"] == 0 else 1
+
+def run_watch_cli(args, cache, job_options=None):
+    if len(args.inputs) != 1 or not os.path.isdir(args.inputs[0]):
+        print("❌ Mode --watch membutuhkan tepat satu folder input.", file=sys.stderr)
+        return 2
+
+    def on_record(job, record):
+        if record["ok"]:
+            print(f"OK {job['input_path']} ({record['seconds']:.2f} detik)", flush=True)
+        else:
+            print(f"GAGAL {job['input_path']}: {record['error_type']}: {record['error']}", flush=True)
+
+    print(f"👀 Memantau {args.inputs[0]} (Ctrl+C untuk berhenti)...", flush=True)
+    try:
+        stats = watch_folder(
+            args.inputs[0], args.output_dir, args.category, args.from_format, args.to_format,
+            target_size_kb=args.target_kb, max_dimension=args.max_dim, workers=args.jobs, cache=cache,
+            debounce=args.debounce, queue_size=args.queue_size, on_record=on_record,
+            log_path=args.log, docx_backend=args.docx_backend, fsync=args.fsync, job_options=job_options
+        )
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+    print(f"Berhenti: {stats['success']} berhasil, {stats['failed']} gagal, {stats['skipped']} dilewati.")
+    return 0
+
+def run_serve_cli(argv):
+    args = build_serve_arg_parser().parse_args(argv)
+
+    def on_ready(server):
+        host, port = server.server_address[:2]
+        print(f"🌐 Layanan konversi berjalan di http://{host}:{port} (Ctrl+C untuk berhenti)...", flush=True)
+
+    try:
+        serve(
+            args.host, args.port, on_ready=on_ready, workers=args.jobs, cache=cli_cache(args),
+            queue_size=args.queue_size, timeout=args.timeout, max_upload_bytes=args.max_upload_mb * 1024 * 1024,
+            allowed_roots=args.allow_path, docx_backend=args.docx_backend, fsync=args.fsync
+        )
+    except OSError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+    print("Layanan dihentikan.")
+    return 0
+
+# Pilihan "Ke Format" di GUI untuk meng-encode gambar ke semua format tujuan sekaligus.
+MULTI_TARGET_OPTION = "Semua Format"
+
+# Pilihan "Dari Format" di GUI untuk batch campuran dengan deteksi format otomatis.
+AUTO_FORMAT_OPTION = "Otomatis"
+
+# Interval (ms) GUI menguras antrean progres; membatasi refresh ke ~10x per detik.
+PROGRESS_REFRESH_MS = 100
+
+def format_eta(seconds):
+    seconds = int(round(seconds))
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}j {minutes}m"
+    if minutes:
+        return f"{minutes}m {seconds}d"
+    return f"{seconds}d"
+
+def run_gui():
+    _load_gui()
+    root = ttk.Window(themename="cosmo")
+    app = ConverterApp(root)
+    root.mainloop()
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        run_gui()
+        return 0
+    if argv[0] == "serve":
+        return run_serve_cli(argv[1:])
+    return run_cli(argv)
 
 class ConverterApp:
     def __init__(self, root):
@@ -129,6 +2974,11 @@ class ConverterApp:
         self.from_format_var = tk.StringVar()
         self.to_format_var = tk.StringVar()
         self.target_size_var = tk.StringVar(value="1024")
+        self.workers_var = tk.StringVar(value=str(DEFAULT_WORKERS))
+        self.use_cache_var = tk.BooleanVar(value=True)
+        self.all_sheets_var = tk.BooleanVar(value=False)
+        self.max_dimension_var = tk.StringVar(value="")
+        self.optimize_var = tk.StringVar(value=OPTIMIZE_LEVEL_NAMES[0])
         self.progress_text_var = tk.StringVar(value="")
         
         self.create_widgets()
@@ -136,7 +2986,7 @@ class ConverterApp:
 
     def create_widgets(self):
         main_container = ttk.Frame(self.root)
-        main_container.pack(fill=BOTH, expand=True)
+        main_container.pack(fill="both", expand=True)
         
         self.canvas = tk.Canvas(main_container, highlightthickness=0)
         scrollbar = ttk.Scrollbar(main_container, orient="vertical", command=self.canvas.yview)
@@ -154,10 +3004,10 @@ class ConverterApp:
         scrollbar.pack(side="right", fill="y")
         
         main_frame = ttk.Frame(self.scrollable_frame, padding="30")
-        main_frame.pack(fill=BOTH, expand=True)
+        main_frame.pack(fill="both", expand=True)
 
         header_frame = ttk.Frame(main_frame)
-        header_frame.pack(fill=X, pady=(0, 30))
+        header_frame.pack(fill="x", pady=(0, 30))
         
         title_label = ttk.Label(
             header_frame, 
@@ -181,7 +3031,7 @@ class ConverterApp:
             padding=25,
             bootstyle="primary"
         )
-        options_card.pack(fill=X, pady=(0, 20))
+        options_card.pack(fill="x", pady=(0, 20))
         options_card.grid_columnconfigure(1, weight=1)
 
         cat_frame = ttk.Frame(options_card)
@@ -241,12 +3091,73 @@ class ConverterApp:
         )
         self.target_size_entry.grid(row=0, column=1, sticky="ew")
 
+        self.max_dimension_frame = ttk.Frame(options_card)
+        self.max_dimension_frame.grid(row=4, column=0, columnspan=2, sticky="ew", pady=(0, 15))
+        self.max_dimension_frame.grid_columnconfigure(1, weight=1)
+
+        ttk.Label(self.max_dimension_frame, text="📏 Dimensi Maks (px):", font=("Segoe UI", 11)).grid(row=0, column=0, padx=(0, 10), sticky="w")
+        self.max_dimension_entry = ttk.Entry(
+            self.max_dimension_frame,
+            textvariable=self.max_dimension_var,
+            font=("Segoe UI", 10),
+            width=25
+        )
+        self.max_dimension_entry.grid(row=0, column=1, sticky="ew")
+
+        self.optimize_frame = ttk.Frame(options_card)
+        self.optimize_frame.grid(row=8, column=0, columnspan=2, sticky="ew", pady=(10, 0))
+        self.optimize_frame.grid_columnconfigure(1, weight=1)
+
+        ttk.Label(self.optimize_frame, text="🗜️ Optimasi PNG/WEBP:", font=("Segoe UI", 11)).grid(row=0, column=0, padx=(0, 10), sticky="w")
+        self.optimize_menu = ttk.Combobox(
+            self.optimize_frame,
+            textvariable=self.optimize_var,
+            values=list(OPTIMIZE_LEVEL_NAMES.values()),
+            state="readonly",
+            font=("Segoe UI", 10),
+            width=25
+        )
+        self.optimize_menu.grid(row=0, column=1, sticky="ew")
+        self.optimize_frame.grid_remove()
+
+        workers_frame = ttk.Frame(options_card)
+        workers_frame.grid(row=5, column=0, columnspan=2, sticky="ew", pady=(0, 15))
+        workers_frame.grid_columnconfigure(1, weight=1)
+
+        ttk.Label(workers_frame, text="⚙️ Jumlah Worker:", font=("Segoe UI", 11)).grid(row=0, column=0, padx=(0, 10), sticky="w")
+        self.workers_spinbox = ttk.Spinbox(
+            workers_frame,
+            textvariable=self.workers_var,
+            from_=1,
+            to=max(DEFAULT_WORKERS * 2, 2),
+            font=("Segoe UI", 10),
+            width=23
+        )
+        self.workers_spinbox.grid(row=0, column=1, sticky="ew")
+
+        self.use_cache_check = ttk.Checkbutton(
+            options_card,
+            text="♻️ Gunakan cache (lewati file yang sudah pernah dikonversi)",
+            variable=self.use_cache_var,
+            bootstyle="round-toggle"
+        )
+        self.use_cache_check.grid(row=6, column=0, columnspan=2, sticky="w")
+
+        self.all_sheets_check = ttk.Checkbutton(
+            options_card,
+            text="📑 Ekspor semua sheet XLSX (satu file CSV per sheet)",
+            variable=self.all_sheets_var,
+            bootstyle="round-toggle"
+        )
+        self.all_sheets_check.grid(row=7, column=0, columnspan=2, sticky="w", pady=(10, 0))
+        self.all_sheets_check.grid_remove()
+
         self.category_var.trace("w", self.update_format_options)
         self.from_format_var.trace("w", self.update_output_options)
         self.to_format_var.trace("w", lambda *_: self.check_and_enable_button())
 
         io_main_frame = ttk.Frame(main_frame)
-        io_main_frame.pack(fill=X, pady=(0, 20))
+        io_main_frame.pack(fill="x", pady=(0, 20))
         
         files_card = ttk.Labelframe(
             io_main_frame, 
@@ -254,25 +3165,25 @@ class ConverterApp:
             padding=20,
             bootstyle="info"
         )
-        files_card.pack(fill=BOTH, expand=True, side=LEFT, padx=(0, 10))
+        files_card.pack(fill="both", expand=True, side="left", padx=(0, 10))
         
         select_files_button = ttk.Button(
             files_card, 
             text="🔍 Pilih File", 
             command=self.select_files, 
-            bootstyle=(PRIMARY, OUTLINE),
+            bootstyle=("primary", "outline"),
             width=15
         )
         select_files_button.pack(pady=(0, 15))
         
         self.files_display_frame = ttk.Frame(files_card)
-        self.files_display_frame.pack(fill=BOTH, expand=True)
+        self.files_display_frame.pack(fill="both", expand=True)
         
         self.files_label = ttk.Label(
             self.files_display_frame, 
             textvariable=self.files_label_var, 
             wraplength=300, 
-            justify=CENTER,
+            justify="center",
             font=("Segoe UI", 10),
             foreground="#34495e"
         )
@@ -284,13 +3195,13 @@ class ConverterApp:
             padding=20,
             bootstyle="success"
         )
-        output_card.pack(fill=BOTH, expand=True, side=RIGHT, padx=(10, 0))
+        output_card.pack(fill="both", expand=True, side="right", padx=(10, 0))
         
         select_folder_button = ttk.Button(
             output_card, 
             text="📁 Pilih Folder", 
             command=self.select_output_folder, 
-            bootstyle=(SUCCESS, OUTLINE),
+            bootstyle=("success", "outline"),
             width=15
         )
         select_folder_button.pack(pady=(0, 15))
@@ -300,9 +3211,9 @@ class ConverterApp:
             textvariable=self.output_folder_path, 
             state="readonly", 
             font=("Segoe UI", 9),
-            justify=CENTER
+            justify="center"
         )
-        self.output_folder_entry.pack(fill=X, pady=10)
+        self.output_folder_entry.pack(fill="x", pady=10)
 
         process_card = ttk.Labelframe(
             main_frame, 
@@ -310,20 +3221,20 @@ class ConverterApp:
             padding=25,
             bootstyle="warning"
         )
-        process_card.pack(fill=X, pady=(0, 20))
+        process_card.pack(fill="x", pady=(0, 20))
 
         self.convert_button = ttk.Button(
             process_card, 
             text="🚀 Mulai Proses Konversi", 
             command=self.start_conversion_thread, 
-            bootstyle=(SUCCESS, "outline-toolbutton"),
+            bootstyle=("success", "outline-toolbutton"),
             state="disabled",
             width=30
         )
         self.convert_button.pack(pady=(0, 20))
 
         progress_frame = ttk.Frame(process_card)
-        progress_frame.pack(fill=X)
+        progress_frame.pack(fill="x")
         
         self.progress_label = ttk.Label(
             progress_frame, 
@@ -336,13 +3247,13 @@ class ConverterApp:
         self.progress_bar = ttk.Progressbar(
             progress_frame, 
             mode='determinate', 
-            bootstyle=(SUCCESS, STRIPED),
+            bootstyle=("success", "striped"),
             length=400
         )
-        self.progress_bar.pack(fill=X, pady=(0, 15))
+        self.progress_bar.pack(fill="x", pady=(0, 15))
 
         status_card = ttk.Frame(main_frame)
-        status_card.pack(fill=X, pady=(0, 10))
+        status_card.pack(fill="x", pady=(0, 10))
         
         status_inner = ttk.Label(
             status_card,
@@ -354,7 +3265,7 @@ class ConverterApp:
             borderwidth=1,
             padding=(15, 10)
         )
-        status_inner.pack(fill=X)
+        status_inner.pack(fill="x")
 
         self.canvas.bind("<MouseWheel>", self._on_mousewheel)
         self.root.bind("<Configure>", self._on_window_resize)
@@ -368,6 +3279,8 @@ class ConverterApp:
     def update_format_options(self, *args):
         category = self.category_var.get()
         formats = CONVERSION_CONFIG.get(category, {}).get("formats", [])
+        if len(formats) > 1:
+            formats = formats + [AUTO_FORMAT_OPTION]
         self.from_format_menu.config(values=formats, state="readonly" if formats else "disabled")
         self.from_format_var.set("")
         self.to_format_var.set("")
@@ -380,7 +3293,13 @@ class ConverterApp:
     def update_output_options(self, *args):
         category = self.category_var.get()
         from_format = self.from_format_var.get()
-        output_formats = CONVERSION_CONFIG.get(category, {}).get("output_map", {}).get(from_format, [])
+        output_map = CONVERSION_CONFIG.get(category, {}).get("output_map", {})
+        if from_format == AUTO_FORMAT_OPTION:
+            output_formats = list(dict.fromkeys(fmt for outputs in output_map.values() for fmt in outputs))
+        else:
+            output_formats = output_map.get(from_format, [])
+        if category == "Gambar" and len(output_formats) > 1:
+            output_formats = output_formats + [MULTI_TARGET_OPTION]
         self.to_format_menu.config(values=output_formats, state="readonly" if output_formats else "disabled")
         self.to_format_var.set("")
 
@@ -388,6 +3307,21 @@ class ConverterApp:
             self.target_size_frame.grid()
         else:
             self.target_size_frame.grid_remove()
+
+        if category in ("Gambar", "Kompresi"):
+            self.max_dimension_frame.grid()
+        else:
+            self.max_dimension_frame.grid_remove()
+
+        if category == "Gambar":
+            self.optimize_frame.grid()
+        else:
+            self.optimize_frame.grid_remove()
+
+        if category == "Dokumen" and from_format in ("XLSX", AUTO_FORMAT_OPTION):
+            self.all_sheets_check.grid()
+        else:
+            self.all_sheets_check.grid_remove()
             
         self.check_and_enable_button()
 
@@ -397,8 +3331,13 @@ class ConverterApp:
             messagebox.showwarning("⚠️ Peringatan", "Harap pilih format input terlebih dahulu.")
             return
             
-        file_extension = f"*.{from_format.lower()}"
-        file_type_desc = f"{from_format} Files"
+        if from_format == AUTO_FORMAT_OPTION:
+            formats = CONVERSION_CONFIG.get(self.category_var.get(), {}).get("formats", [])
+            file_extension = " ".join(f"*{ext}" for fmt in formats for ext in FORMAT_EXTENSIONS.get(fmt, ()))
+            file_type_desc = "Semua Format Didukung"
+        else:
+            file_extension = f"*.{from_format.lower()}"
+            file_type_desc = f"{from_format} Files"
         
         filepaths = filedialog.askopenfilenames(
             title=f"Pilih File {from_format}",
@@ -417,25 +3356,63 @@ class ConverterApp:
             self.output_folder_path.set(folder_path)
             self.status_var.set("📁 Folder output telah dipilih.")
             self.check_and_enable_button()
+            self.offer_resume(folder_path)
+
+    def offer_resume(self, output_folder):
+        """Tawarkan melanjutkan batch terputus bila folder output berisi manifest yang belum selesai."""
+        manifest = JobManifest(output_folder, resume=True).load()
+        remaining = manifest.unfinished_count()
+        if not remaining:
+            return
+        jobs = manifest.jobs()
+        if not messagebox.askyesno(
+            "♻️ Lanjutkan Batch",
+            f"Ditemukan batch yang belum selesai di folder ini ({remaining} dari {len(jobs)} file belum diproses).\n\n"
+            "Lanjutkan batch tersebut?"
+        ):
+            return
+        try:
+            workers = max(1, int(self.workers_var.get()))
+        except ValueError:
+            workers = DEFAULT_WORKERS
+        self.launch_jobs(jobs, workers, manifest)
 
     def start_conversion_thread(self):
         """Mulai proses di thread terpisah agar GUI tidak macet."""
+        prepared = self.prepare_jobs()
+        if prepared is None:
+            return
+        jobs, workers = prepared
+        self.launch_jobs(jobs, workers, JobManifest(self.output_folder_path.get()))
+
+    def launch_jobs(self, jobs, workers, manifest):
+        cache = ConversionCache() if self.use_cache_var.get() else None
+        # Variabel Tk hanya dibaca di thread utama; thread latar menerima nilainya.
+        log_path = default_log_path(self.output_folder_path.get())
+
         self.convert_button.config(state="disabled", text="⏳ Sedang Memproses...")
         self.progress_bar['value'] = 0
-        self.progress_text_var.set("🔄 Mempersiapkan proses konversi...")
-        
-        conversion_thread = threading.Thread(target=self.run_conversion, daemon=True)
+        self.progress_bar['maximum'] = len(jobs)
+        self.progress_text_var.set(f"🔄 Memproses {len(jobs)} file dengan {workers} worker...")
+
+        self.progress_queue = queue.Queue()
+        self.progress_state = {"done": 0, "total": len(jobs), "success": 0, "failed": 0, "filename": "", "start": time.time()}
+
+        conversion_thread = threading.Thread(
+            target=self.run_conversion, args=(jobs, workers, cache, manifest, log_path), daemon=True
+        )
         conversion_thread.start()
+        self.root.after(PROGRESS_REFRESH_MS, self.drain_progress_events)
 
-    def run_conversion(self):
+    def prepare_jobs(self):
+        """Validasi pilihan pengguna dan susun daftar job; None bila tidak valid."""
         from_format = self.from_format_var.get()
         to_format = self.to_format_var.get()
         category = self.category_var.get()
         
         if not all([self.list_of_files, self.output_folder_path.get(), from_format, to_format]):
             messagebox.showerror("❌ Error", "Harap lengkapi semua pilihan sebelum memulai proses.")
-            self.reset_button_state()
-            return
+            return None
         
         target_size_kb = None
         if category == "Kompresi" and from_format == "JPG":
@@ -443,58 +3420,133 @@ class ConverterApp:
                 target_size_kb = int(self.target_size_var.get())
                 if target_size_kb <= 0:
                     messagebox.showerror("❌ Error", "Target ukuran harus angka positif.")
-                    self.reset_button_state()
-                    return
+                    return None
             except ValueError:
                 messagebox.showerror("❌ Error", "Target ukuran harus berupa angka.")
-                self.reset_button_state()
-                return
+                return None
 
-        total_files = len(self.list_of_files)
-        self.progress_bar['maximum'] = total_files
-        success_count = 0
-        fail_count = 0
+        max_dimension = None
+        if category in ("Gambar", "Kompresi") and self.max_dimension_var.get().strip():
+            try:
+                max_dimension = int(self.max_dimension_var.get())
+                if max_dimension <= 0:
+                    raise ValueError
+            except ValueError:
+                messagebox.showerror("❌ Error", "Dimensi maksimum harus angka positif.")
+                return None
 
-        start_time = time.time()
+        try:
+            workers = int(self.workers_var.get())
+            if workers <= 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("❌ Error", "Jumlah worker harus angka positif.")
+            return None
 
-        for i, input_path in enumerate(self.list_of_files):
-            filename = os.path.basename(input_path)
-            
-            if category == "Kompresi":
-                base, ext = os.path.splitext(filename)
-                output_filename = f"{base}_terkompresi{ext}"
+        output_map = CONVERSION_CONFIG[category]["output_map"]
+        if to_format == MULTI_TARGET_OPTION:
+            if from_format == AUTO_FORMAT_OPTION:
+                to_format = list(dict.fromkeys(fmt for outputs in output_map.values() for fmt in outputs))
             else:
-                output_filename = os.path.splitext(filename)[0] + f".{to_format.lower()}"
+                to_format = output_map[from_format]
 
-            output_path = os.path.join(self.output_folder_path.get(), output_filename)
-            
-            self.progress_text_var.set(f"🔄 Memproses ({i+1}/{total_files}): {filename}")
-            self.status_var.set(f"⚡ Sedang memproses file ke-{i+1} dari {total_files}")
-            
-            if convert_file(input_path, output_path, from_format, to_format, category, target_size_kb=target_size_kb):
-                success_count += 1
-            else:
-                fail_count += 1
-            
-            self.progress_bar['value'] = i + 1
-            self.root.update_idletasks()
-            
-            time.sleep(0.1)
+        sheets = ALL_SHEETS if category == "Dokumen" and self.all_sheets_var.get() else None
+        optimize = None
+        if category == "Gambar":
+            levels = {name: level for level, name in OPTIMIZE_LEVEL_NAMES.items()}
+            optimize = levels.get(self.optimize_var.get()) or None
+        output_folder = self.output_folder_path.get()
+        if from_format == AUTO_FORMAT_OPTION:
+            jobs, skipped = plan_auto_jobs(
+                self.list_of_files, output_folder, category, to_format, target_size_kb, max_dimension,
+                sheets=sheets, optimize=optimize
+            )
+            if not jobs:
+                messagebox.showerror("❌ Error", "Tidak ada file yang formatnya bisa dikonversi ke format tujuan.")
+                return None
+            if skipped:
+                examples = "\n".join(
+                    f"• {os.path.basename(item['input_path'])}: {item['reason']}" for item in skipped[:5]
+                )
+                messagebox.showwarning("⚠️ Peringatan", f"{len(skipped)} file dilewati:\n{examples}")
+        else:
+            jobs = [
+                make_job(
+                    input_path, output_folder, category, from_format, to_format, target_size_kb, max_dimension,
+                    sheets=sheets, optimize=optimize
+                )
+                for input_path in self.list_of_files
+            ]
+        return jobs, workers
+
+    def run_conversion(self, jobs, workers, cache, manifest=None, log_path=None):
+        """Dijalankan di thread latar; hanya mengirim event ke antrean, tidak menyentuh widget Tk."""
+        def on_progress(done, total, job, record):
+            self.progress_queue.put(("progress", done, os.path.basename(job["input_path"]), record["ok"]))
+
+        try:
+            summary = run_batch(
+                jobs, workers=workers, on_progress=on_progress, cache=cache, log_path=log_path, manifest=manifest
+            )
+        except Exception as e:
+            self.progress_queue.put(("error", str(e)))
+        else:
+            self.progress_queue.put(("done", summary))
+
+    def drain_progress_events(self):
+        """Ambil semua event dari antrean dan perbarui UI paling banyak sekali per interval refresh."""
+        state = self.progress_state
+        finished = None
+        try:
+            while True:
+                event = self.progress_queue.get_nowait()
+                if event[0] == "progress":
+                    _, state["done"], state["filename"], ok = event
+                    state["success" if ok else "failed"] += 1
+                else:
+                    finished = event
+        except queue.Empty:
+            pass
+
+        done = state["done"]
+        total = state["total"]
+        if done:
+            elapsed = max(time.time() - state["start"], 1e-6)
+            rate = done / elapsed
+            eta = (total - done) / rate if rate > 0 else 0
+            self.progress_bar['value'] = done
+            self.progress_text_var.set(f"🔄 Selesai ({done}/{total}): {state['filename']}")
+            self.status_var.set(
+                f"⚡ {rate:.1f} file/detik • ✅ {state['success']} • ❌ {state['failed']} • ⏳ sisa ±{format_eta(eta)}"
+            )
+
+        if finished is None:
+            self.root.after(PROGRESS_REFRESH_MS, self.drain_progress_events)
+        elif finished[0] == "error":
+            messagebox.showerror("❌ Error", f"Proses konversi gagal: {finished[1]}")
+            self.reset_button_state()
+        else:
+            self.finish_conversion(finished[1])
+
+    def finish_conversion(self, summary):
+        success_count = summary["success"]
+        fail_count = summary["failed"]
+        duration = summary["duration"]
+        throughput = summary["files_per_sec"]
 
-        end_time = time.time()
-        duration = round(end_time - start_time, 2)
-        
         self.progress_text_var.set("✅ Proses konversi selesai!")
         self.status_var.set(f"🎉 Proses selesai dalam {duration} detik.")
         
         if fail_count == 0:
             icon = "🎉"
             title = "Berhasil!"
-            message = f"{icon} Semua file berhasil diproses!\n\n✅ Berhasil: {success_count}\n⏱️ Waktu: {duration} detik"
+            message = f"{icon} Semua file berhasil diproses!\n\n✅ Berhasil: {success_count} (♻️ {summary['cached']} dari cache, ⏭️ {summary['resumed']} dilanjutkan)\n⏱️ Waktu: {duration} detik\n⚡ Kecepatan: {throughput} file/detik"
         else:
             icon = "⚠️"
             title = "Proses Selesai"
-            message = f"{icon} Proses Selesai!\n\n✅ Berhasil: {success_count}\n❌ Gagal: {fail_count}\n⏱️ Waktu: {duration} detik"
+            message = f"{icon} Proses Selesai!\n\n✅ Berhasil: {success_count} (♻️ {summary['cached']} dari cache, ⏭️ {summary['resumed']} dilanjutkan)\n❌ Gagal: {fail_count}\n⏱️ Waktu: {duration} detik\n⚡ Kecepatan: {throughput} file/detik"
+
+        message += "\n\n" + format_run_report(summary)
             
         messagebox.showinfo(title, message)
         
@@ -521,6 +3573,5 @@ class ConverterApp:
         self.convert_button.config(state="disabled", text="🚀 Mulai Proses Konversi")
 
 if __name__ == "__main__":
-    root = ttk.Window(themename="cosmo")
-    app = ConverterApp(root)
-    root.mainloop()
+    multiprocessing.freeze_support()
+    sys.exit(main())
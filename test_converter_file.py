@@ -0,0 +1,131 @@
+import pytest
+
+import converter_file
+
+pytest.importorskip("PIL")
+
+@pytest.fixture(scope="module")
+def jpeg_sizes():
+    """Gambar fixture beserta ukuran JPEG resolusi penuh di setiap kualitas."""
+    Image = converter_file._pil_image()
+    from PIL import ImageFilter
+
+    size = (1600, 1200)
+    gradient = Image.linear_gradient("L").resize(size)
+    noise = Image.effect_noise(size, 64)
+    detail = Image.effect_noise(size, 32).filter(ImageFilter.GaussianBlur(2))
+    img = Image.merge("RGB", (gradient, noise, detail)).filter(ImageFilter.GaussianBlur(1))
+    sizes = {
+        quality: converter_file._encode_jpeg(img, quality).tell()
+        for quality in range(converter_file.JPEG_QUALITY_MIN, converter_file.JPEG_QUALITY_MAX + 1)
+    }
+    return img, sizes
+
+@pytest.mark.parametrize("max_full_encodes", [0, 1, converter_file.MAX_FULL_ENCODES])
+@pytest.mark.parametrize("fraction", [0.3, 0.5, 0.7, 0.9])
+def test_compress_jpeg_to_target_matches_brute_force(jpeg_sizes, fraction, max_full_encodes, monkeypatch):
+    img, sizes = jpeg_sizes
+    target_bytes = int(sizes[converter_file.JPEG_QUALITY_MAX] * fraction)
+    expected = max(quality for quality, size in sizes.items() if size <= target_bytes)
+
+    encode_jpeg = converter_file._encode_jpeg
+    full_encodes = []
+
+    def counting_encode(image, quality, metadata=None):
+        if image is img:
+            full_encodes.append(quality)
+        return encode_jpeg(image, quality, metadata)
+
+    monkeypatch.setattr(converter_file, "_encode_jpeg", counting_encode)
+    buffer, quality = converter_file.compress_jpeg_to_target(img, target_bytes, max_full_encodes)
+
+    assert quality == expected
+    assert buffer.tell() == sizes[expected]
+    if max_full_encodes:
+        # Tebakan proxy + verifikasi q+1, ditambah paling banyak satu koreksi secant.
+        assert len(full_encodes) <= 3, full_encodes
+
+class _BrokenSession:
+    def convert(self, pairs, fsync=False):
+        raise OSError("COM error")
+
+    def close(self):
+        raise OSError("sudah mati")
+
+def test_docx_pool_records_failures_when_session_raises(tmp_path, monkeypatch):
+    opened = []
+
+    def open_session(backend=None):
+        opened.append(backend)
+        if len(opened) == 1:
+            raise RuntimeError("LibreOffice gagal start")
+        return _BrokenSession()
+
+    monkeypatch.setattr(converter_file, "open_docx_session", open_session)
+    jobs = [
+        converter_file.make_job(str(tmp_path / f"dok{i}.docx"), str(tmp_path / "hasil"), "Dokumen", "DOCX", "PDF")
+        for i in range(3)
+    ]
+    records = []
+    with converter_file.DocxPdfPool(workers=1, backend="libreoffice", batch_size=1) as pool:
+        pool.submit(jobs, lambda job, record: records.append(record))
+        pool.join()
+
+    assert [record["error_type"] for record in records] == ["RuntimeError", "OSError", "OSError"]
+    # Sesi yang melempar exception ditutup dan dibuka ulang untuk chunk berikutnya.
+    assert len(opened) == 3
+
+def test_dtype_int_rejects_fractional_values():
+    assert converter_file._cast_int("3") == 3
+    assert converter_file._cast_int("2.0") == 2
+    with pytest.raises(ValueError):
+        converter_file._cast_int("1.5")
+    with pytest.raises(ValueError):
+        converter_file._cast_int(1.5)
+
+def test_xlsx_engines_write_identical_csv(tmp_path):
+    pytest.importorskip("openpyxl")
+    pytest.importorskip("python_calamine")
+    import datetime
+    from openpyxl import Workbook
+
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(["tanggal", "waktu", "jam", "nilai", "jumlah"])
+    sheet.append([datetime.date(2024, 2, 1), datetime.datetime(2024, 2, 1, 13, 45, 10), datetime.time(7, 30), 1.5, 3])
+    workbook.save(tmp_path / "tabel.xlsx")
+
+    outputs = {}
+    for engine in ("openpyxl", "calamine"):
+        output_path = tmp_path / f"{engine}.csv"
+        converter_file.stream_xlsx_to_csv(str(tmp_path / "tabel.xlsx"), str(output_path), engine=engine)
+        outputs[engine] = output_path.read_bytes()
+    assert outputs["openpyxl"] == outputs["calamine"]
+    data_row = outputs["openpyxl"].decode("utf-8").splitlines()[1]
+    assert data_row.startswith("2024-02-01,2024-02-01 13:45:10,07:30:00,")
+
+def test_run_report_without_failure_list_has_no_remainder_line():
+    summary = {"bytes_in": 0, "bytes_out": 0, "failures": [
+        {"input_path": "a.jpg", "error_type": "OSError", "error": "rusak"},
+        {"input_path": "b.jpg", "error_type": "OSError", "error": "rusak"},
+    ]}
+    assert "kegagalan lainnya" not in converter_file.format_run_report(summary, max_failures=0)
+    assert "… dan 1 kegagalan lainnya" in converter_file.format_run_report(summary, max_failures=1)
+
+def test_optimized_encode_prefers_default_on_tie(monkeypatch):
+    Image = converter_file._pil_image()
+    monkeypatch.setitem(converter_file.OPTIMIZE_CANDIDATES, "sama", (None, {}))
+    monkeypatch.setitem(converter_file.OPTIMIZE_LEVELS, 1, {"PNG": ["sama"]})
+
+    _, info = converter_file._optimized_encode(Image.new("RGB", (64, 64), "red"), "PNG", 1)
+
+    assert info["choice"] == "default"
+    assert info["saved"] == 0
+
+def test_optimized_encode_starts_no_trial_after_budget():
+    Image = converter_file._pil_image()
+
+    _, info = converter_file._optimized_encode(Image.new("RGB", (64, 64), "red"), "PNG", 3, budget=0)
+
+    assert info["choice"] == "default"
+    assert info["timed_out"] == converter_file.OPTIMIZE_LEVELS[3]["PNG"]